@@ -25,19 +25,19 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# One-dir build: the bootloader runs straight from the installed directory
+# instead of unpacking a onefile archive to a temp dir on every launch.
+# UPX is off because compressed libraries are inflated again at each load.
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='DINKIssTyle-Bora',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -45,3 +45,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='DINKIssTyle-Bora',
+)
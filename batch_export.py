@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, ALL_COMPLETED, wait
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+# format name -> (file extension, Pillow format, save options)
+FORMATS = {
+    'png': ('png', 'PNG', {'compress_level': 6}),
+    'jpg': ('jpg', 'JPEG', {'quality': 92}),
+    'webp': ('webp', 'WEBP', {'quality': 90}),
+}
+# Raw pixel bytes allowed in outstanding jobs; each is also pickled to a worker
+DEFAULT_MAX_IN_FLIGHT_MB = 256
+
+
+def encode_image(path, fmt, width, height, data):
+    """Runs in a pool worker: encode raw BGRA pixels to `path`. Returns bytes written."""
+    from PIL import Image
+
+    _, pil_format, options = FORMATS[fmt]
+    image = Image.frombuffer('RGBA', (width, height), data, 'raw', 'BGRA', 0, 1)
+    if pil_format == 'JPEG':
+        image = image.convert('RGB')
+    image.save(path, pil_format, **options)
+    return os.path.getsize(path)
+
+
+def convert_file(path, fmt, source_path):
+    """Runs in a pool worker: re-encode an image file (e.g. a saved session image)."""
+    from PIL import Image
+
+    _, pil_format, options = FORMATS[fmt]
+    with Image.open(source_path) as image:
+        if pil_format == 'JPEG':
+            image = image.convert('RGB')
+        image.save(path, pil_format, **options)
+    return os.path.getsize(path)
+
+
+class BatchExporter(QObject):
+    """
+    Encodes many images on a process pool, one worker per core.
+
+    Raw pixels are pulled from the QImages only as work is submitted, and
+    outstanding jobs are capped both in number (`max_in_flight`) and in raw
+    bytes (`max_in_flight_bytes`), so memory stays bounded no matter how many
+    or how large the images are. Runs on a background thread and reports
+    through the progress/finished signals.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, items, out_dir, fmt='png', workers=None, max_in_flight_mb=None, parent=None):
+        super().__init__(parent)
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported format: {fmt}")
+        # List of (base name, QImage or path of an image file not yet decoded)
+        self.items = items
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = self.workers * 2
+        self.max_in_flight_bytes = (max_in_flight_mb or DEFAULT_MAX_IN_FLIGHT_MB) * 1024 * 1024
+
+    def start(self):
+        threading.Thread(target=self.run, name="bora-export", daemon=True).start()
+
+    def run(self):
+        start = time.perf_counter()
+        self.done = 0
+        self.exported = 0
+        self.pixels = 0
+        self.written = 0
+        self.errors = []
+        try:
+            self.export_all()
+        except Exception as e:
+            # Always report, or the caller would wait for finished forever
+            self.errors.append(str(e))
+
+        elapsed = time.perf_counter() - start
+        self.finished.emit({
+            'ok': not self.errors,
+            'exported': self.exported,
+            'errors': self.errors,
+            'directory': self.out_dir,
+            'format': self.fmt,
+            'workers': self.workers,
+            'seconds': round(elapsed, 3),
+            'images_per_second': round(self.done / elapsed, 2) if elapsed else None,
+            'megapixels_per_second': round(self.pixels / 1e6 / elapsed, 2) if elapsed else None,
+            'bytes_written': self.written,
+        })
+
+    def export_all(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        ext = FORMATS[self.fmt][0]
+        pending = {}  # future -> raw bytes it holds
+
+        # spawn: forking a process that runs a Qt event loop is not safe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            def collect(block):
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED if block else ALL_COMPLETED)
+                for future in finished:
+                    del pending[future]
+                    try:
+                        self.written += future.result()
+                        self.exported += 1
+                    except Exception as e:
+                        self.errors.append(str(e))
+                    self.done += 1
+                    self.progress.emit(self.done, len(self.items))
+
+            def wait_for_room(size):
+                # A single image over the budget still goes through on its own
+                while pending and (len(pending) >= self.max_in_flight or
+                                   sum(pending.values()) + size > self.max_in_flight_bytes):
+                    collect(block=True)
+
+            for name, image in self.items:
+                path = os.path.join(self.out_dir, f"{name}.{ext}")
+                if isinstance(image, str):
+                    # Decoded in the worker, never on the GUI thread; only the
+                    # header is read here, for the throughput figure
+                    size = QImageReader(image).size()
+                    self.pixels += max(size.width(), 0) * max(size.height(), 0)
+                    wait_for_room(0)
+                    pending[pool.submit(convert_file, path, self.fmt, image)] = 0
+                    continue
+                wait_for_room(image.width() * image.height() * 4)
+                image = image.convertToFormat(QImage.Format.Format_ARGB32)
+                ptr = image.constBits()
+                ptr.setsize(image.sizeInBytes())
+                data = bytes(ptr)
+                self.pixels += image.width() * image.height()
+                pending[pool.submit(encode_image, path, self.fmt, image.width(), image.height(), data)] = len(data)
+            collect(block=False)
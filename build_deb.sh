@@ -23,11 +23,15 @@ fi
 # 1. Build Binary
 echo "[1/5] Building binary..."
 cd "$SCRIPT_DIR"
+# Render the icon set (skipped when generate_icon.py is unchanged)
+python3 generate_icon.py
 # Clean previous build
 rm -rf "$DIST_DIR" "$SCRIPT_DIR/build"
 
+# --onedir: a onefile binary unpacks itself to a temp dir on every launch
 pyinstaller \
-    --onefile \
+    --onedir \
+    --noupx \
     --name="$APP_NAME" \
     --windowed \
     --add-data="assets:assets" \
@@ -43,24 +47,27 @@ echo "[2/5] Creating directory structure..."
 rm -rf "$WORK_DIR"
 mkdir -p "$WORK_DIR/DEBIAN"
 mkdir -p "$WORK_DIR/usr/bin"
+mkdir -p "$WORK_DIR/usr/lib"
 mkdir -p "$WORK_DIR/usr/share/applications"
-mkdir -p "$WORK_DIR/usr/share/icons/hicolor/128x128/apps"
 
 # 3. Copy Files
 echo "[3/5] Copying files..."
-if [ -f "$DIST_DIR/$APP_NAME" ]; then
-    cp "$DIST_DIR/$APP_NAME" "$WORK_DIR/usr/bin/"
-    chmod 755 "$WORK_DIR/usr/bin/$APP_NAME"
+if [ -f "$DIST_DIR/$APP_NAME/$APP_NAME" ]; then
+    # The whole bundle lives in /usr/lib/bora; /usr/bin/bora points at it
+    cp -r "$DIST_DIR/$APP_NAME" "$WORK_DIR/usr/lib/"
+    chmod 755 "$WORK_DIR/usr/lib/$APP_NAME/$APP_NAME"
+    ln -s "/usr/lib/$APP_NAME/$APP_NAME" "$WORK_DIR/usr/bin/$APP_NAME"
 else
-    echo "Error: Binary not found at $DIST_DIR/$APP_NAME"
+    echo "Error: Binary not found at $DIST_DIR/$APP_NAME/$APP_NAME"
     exit 1
 fi
 
-# Copy Icon
-if [ -f "$ICON_DIR/icon.png" ]; then
-    cp "$ICON_DIR/icon.png" "$WORK_DIR/usr/share/icons/hicolor/128x128/apps/$APP_NAME.png"
+# Copy Icons (every pre-rendered hicolor size)
+if [ -d "$ICON_DIR/icons/hicolor" ]; then
+    mkdir -p "$WORK_DIR/usr/share/icons"
+    cp -r "$ICON_DIR/icons/hicolor" "$WORK_DIR/usr/share/icons/"
 else
-    echo "Warning: Icon not found at $ICON_DIR/icon.png"
+    echo "Warning: Icon set not found at $ICON_DIR/icons/hicolor"
 fi
 
 # Create Desktop File for Package
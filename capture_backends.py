@@ -0,0 +1,277 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QImage, QPainter, QColor
+
+from config_manager import ConfigManager
+
+# Set to a backend name to bypass the registry ranking (e.g. "stub" for testing)
+FORCE_ENV = 'BORA_CAPTURE_BACKEND'
+BENCHMARK_ROUNDS = 2
+
+
+class CaptureError(Exception):
+    pass
+
+
+class CaptureBackend:
+    """
+    A way of grabbing pixels from the screen.
+
+    grab() takes a rect in global (virtual desktop) coordinates and returns a
+    QImage of it, raising on failure. Backends list the session types they
+    work under; `benchmark = False` keeps slow or intrusive backends out of the
+    startup benchmark, ranking them after every measured one. Backends with
+    `region_grabs = False` always capture the whole desktop, so grab_many()
+    calls them once and crops.
+    """
+    name = None
+    sessions = ('x11', 'wayland')
+    benchmark = True
+    region_grabs = True
+
+    def is_available(self):
+        return True
+
+    def grab(self, rect):
+        raise NotImplementedError
+
+
+class MssBackend(CaptureBackend):
+    """XGetImage/XShm via mss. One mss handle per thread, reused across grabs."""
+    name = 'mss'
+    sessions = ('x11',)
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def is_available(self):
+        try:
+            import mss
+        except ImportError:
+            return False
+        return bool(os.environ.get('DISPLAY'))
+
+    def grab(self, rect):
+        import mss
+
+        sct = getattr(self.local, 'sct', None)
+        if sct is None:
+            sct = self.local.sct = mss.mss()
+        monitor = {'left': rect.x(), 'top': rect.y(), 'width': rect.width(), 'height': rect.height()}
+        sct_img = sct.grab(monitor)
+        return QImage(sct_img.bgra, sct_img.width, sct_img.height, QImage.Format.Format_ARGB32).copy()
+
+
+class QtScreenBackend(CaptureBackend):
+    """QScreen.grabWindow on each screen the rect touches. GUI thread only."""
+    name = 'qt'
+    sessions = ('x11',)
+
+    def grab(self, rect):
+        image = QImage(rect.size(), QImage.Format.Format_ARGB32)
+        image.fill(QColor("black"))
+        painter = QPainter(image)
+        for screen in QApplication.screens():
+            part = rect.intersected(screen.geometry())
+            if part.isEmpty():
+                continue
+            origin = screen.geometry().topLeft()
+            pixmap = screen.grabWindow(0, part.x() - origin.x(), part.y() - origin.y(), part.width(), part.height())
+            if pixmap.isNull():
+                painter.end()
+                raise CaptureError(f"grabWindow returned nothing for {screen.name()}")
+            painter.drawPixmap(part.topLeft() - rect.topLeft(), pixmap)
+        painter.end()
+        return image
+
+
+class GnomeScreenshotBackend(CaptureBackend):
+    """
+    The gnome-screenshot CLI, which also works under Wayland. It always
+    captures the whole desktop, so it is slow and stays out of the benchmark.
+    """
+    name = 'gnome-screenshot'
+    benchmark = False
+    region_grabs = False
+
+    def is_available(self):
+        return shutil.which('gnome-screenshot') is not None
+
+    def grab(self, rect):
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tf:
+            temp_filename = tf.name
+        try:
+            subprocess.run(['gnome-screenshot', '-f', temp_filename], check=True)
+            image = QImage(temp_filename)
+        finally:
+            os.remove(temp_filename)
+        if image.isNull():
+            raise CaptureError("gnome-screenshot produced no image")
+        return image.copy(rect.translated(-virtual_geometry().topLeft()))
+
+
+class StubBackend(CaptureBackend):
+    """Deterministic gradient, for testing without a display server."""
+    name = 'stub'
+    benchmark = False
+
+    def is_available(self):
+        return os.environ.get(FORCE_ENV) == self.name
+
+    def grab(self, rect):
+        image = QImage(rect.size(), QImage.Format.Format_ARGB32)
+        image.fill(QColor(40, 40, 40))
+        painter = QPainter(image)
+        painter.fillRect(image.rect().adjusted(0, 0, -image.width() // 2, 0), QColor(90, 60, 160))
+        painter.end()
+        return image
+
+
+BACKENDS = []
+_ranked = {}  # layout key -> available backends, fastest first
+
+
+def register_backend(backend):
+    BACKENDS.append(backend)
+
+
+for _backend in (MssBackend(), QtScreenBackend(), GnomeScreenshotBackend(), StubBackend()):
+    register_backend(_backend)
+
+
+def session_type():
+    return 'wayland' if 'wayland' in os.environ.get('XDG_SESSION_TYPE', '').lower() else 'x11'
+
+
+def virtual_geometry():
+    geometry = QRect()
+    for screen in QApplication.screens():
+        geometry = geometry.united(screen.geometry())
+    return geometry
+
+
+def layout_key():
+    screens = ";".join(
+        f"{g.x()},{g.y()},{g.width()}x{g.height()}"
+        for g in (s.geometry() for s in QApplication.screens())
+    )
+    return f"{session_type()}:{screens}"
+
+
+def available_backends():
+    forced = os.environ.get(FORCE_ENV)
+    if forced:
+        return [b for b in BACKENDS if b.name == forced]
+    session = session_type()
+    return [b for b in BACKENDS if session in b.sessions and b.is_available()]
+
+
+def benchmark(backends, rect=None):
+    """Best-of-N grab latency in seconds per backend name; failing backends are left out."""
+    rect = rect or virtual_geometry()
+    timings = {}
+    for backend in backends:
+        try:
+            best = None
+            for _ in range(BENCHMARK_ROUNDS):
+                start = time.perf_counter()
+                image = backend.grab(rect)
+                elapsed = time.perf_counter() - start
+                if image.isNull():
+                    raise CaptureError("empty image")
+                best = elapsed if best is None else min(best, elapsed)
+            timings[backend.name] = best
+        except Exception as e:
+            print(f"Capture backend '{backend.name}' failed benchmark: {e}")
+    return timings
+
+
+def ranked_backends(measure=True):
+    """
+    Available backends, fastest first. Availability and speed are checked
+    once per session type and screen layout, then cached in memory; the
+    ranking is also persisted to the config file when it can be written.
+
+    With measure=False a layout that hasn't been benchmarked yet gets the
+    registry order instead, uncached, so callers on the startup path don't
+    pay for the benchmark.
+    """
+    key = layout_key()
+    ranked = _ranked.get(key)
+    if ranked is not None:
+        return ranked
+
+    backends = available_backends()
+    if os.environ.get(FORCE_ENV):
+        _ranked[key] = backends
+        return backends
+
+    cached = ConfigManager.get('capture_benchmarks', {})
+    ranking = cached.get(key)
+    if ranking is None and not measure:
+        return backends
+    measured = ranking is None
+    if measured:
+        timings = benchmark([b for b in backends if b.benchmark])
+        ranking = sorted(timings, key=timings.get)
+        print(f"Capture backend benchmark ({key}): " +
+              ", ".join(f"{name}={timings[name] * 1000:.1f}ms" for name in ranking))
+
+    by_name = {b.name: b for b in backends}
+    ordered = [by_name[name] for name in ranking if name in by_name]
+    # Unmeasured backends (failed or not benchmarked) go last, in registry order
+    ranked = _ranked[key] = ordered + [b for b in backends if b not in ordered]
+
+    if measured:
+        # Only saves a benchmark on the next start; capture works without it
+        try:
+            cached[key] = ranking
+            ConfigManager.set('capture_benchmarks', cached)
+        except OSError as e:
+            print(f"Could not save capture benchmark: {e}")
+    return ranked
+
+
+def grab(rect=None):
+    """Grab a global rect (default: the whole virtual desktop) with the best working backend."""
+    rect = rect or virtual_geometry()
+    errors = []
+    for backend in ranked_backends():
+        try:
+            image = backend.grab(rect)
+            if not image.isNull():
+                return image
+            errors.append(f"{backend.name}: empty image")
+        except Exception as e:
+            errors.append(f"{backend.name}: {e}")
+    if not errors:
+        errors.append(f"no capture backend available for a {session_type()} session")
+    raise CaptureError("; ".join(errors))
+
+
+def grab_many(rects):
+    """Grab several global rects (e.g. one per screen) with the same backend."""
+    errors = []
+    for backend in ranked_backends():
+        try:
+            if backend.region_grabs:
+                images = [backend.grab(rect) for rect in rects]
+            else:
+                origin = virtual_geometry().topLeft()
+                desktop = backend.grab(virtual_geometry())
+                images = [desktop.copy(rect.translated(-origin)) for rect in rects]
+            if not any(image.isNull() for image in images):
+                return images
+            errors.append(f"{backend.name}: empty image")
+        except Exception as e:
+            errors.append(f"{backend.name}: {e}")
+    if not errors:
+        errors.append(f"no capture backend available for a {session_type()} session")
+    raise CaptureError("; ".join(errors))
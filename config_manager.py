@@ -1,21 +1,30 @@
 import json
 import os
 
-CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config.json')
+CONFIG_DIR = os.path.join(
+    os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config')),
+    'bora'
+)
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
+# Older versions kept the config next to the code, which is read-only once
+# installed; it is still read until the first save creates CONFIG_FILE
+LEGACY_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
 
 class ConfigManager:
     @staticmethod
     def load_config():
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+        for path in (CONFIG_FILE, LEGACY_CONFIG_FILE):
+            if os.path.exists(path):
+                try:
+                    with open(path, 'r') as f:
+                        return json.load(f)
+                except:
+                    pass
         return {}
 
     @staticmethod
     def save_config(config):
+        os.makedirs(CONFIG_DIR, exist_ok=True)
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=4)
 
@@ -29,3 +38,26 @@ class ConfigManager:
         config = ConfigManager.load_config()
         config['hotkey'] = hotkey_str
         ConfigManager.save_config(config)
+
+    @staticmethod
+    def get_repeat_hotkey():
+        config = ConfigManager.load_config()
+        # Off unless the user picks one in Settings; None or "" disables it
+        return config.get('repeat_hotkey') or None
+
+    @staticmethod
+    def set_repeat_hotkey(hotkey_str):
+        config = ConfigManager.load_config()
+        config['repeat_hotkey'] = hotkey_str
+        ConfigManager.save_config(config)
+
+    @staticmethod
+    def get(key, default=None):
+        config = ConfigManager.load_config()
+        return config.get(key, default)
+
+    @staticmethod
+    def set(key, value):
+        config = ConfigManager.load_config()
+        config[key] = value
+        ConfigManager.save_config(config)
@@ -0,0 +1,78 @@
+import os
+
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QKeySequenceEdit
+from PyQt6.QtGui import QKeySequence, QPixmap
+from PyQt6.QtCore import Qt
+
+from config_manager import ConfigManager
+
+class AboutDialog(QDialog):
+    def __init__(self, icon_path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("About Bora")
+        self.setFixedSize(300, 200)
+        
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Icon
+        icon_label = QLabel(self)
+        if os.path.exists(icon_path):
+            pixmap = QPixmap(icon_path)
+            if pixmap.width() != 64:
+                # Only the legacy single icon needs scaling; about.png is pre-rendered at 64px
+                pixmap = pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            icon_label.setPixmap(pixmap)
+        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(icon_label)
+        
+        # Title
+        title = QLabel("Bora", self)
+        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title)
+        
+        # Copyright
+        copyright = QLabel("(C) 2025 DINKI'ssTyle", self)
+        copyright.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(copyright)
+
+class SettingsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Settings")
+        self.setFixedSize(300, 210)
+        
+        layout = QVBoxLayout(self)
+        
+        layout.addWidget(QLabel("Capture Hotkey:"))
+        
+        self.key_edit = QKeySequenceEdit(self)
+        current_hotkey = ConfigManager.get_hotkey()
+        self.key_edit.setKeySequence(QKeySequence(current_hotkey))
+        layout.addWidget(self.key_edit)
+        
+        layout.addWidget(QLabel("Repeat Last Region Hotkey (empty = off):"))
+        
+        self.repeat_key_edit = QKeySequenceEdit(self)
+        self.repeat_key_edit.setKeySequence(QKeySequence(ConfigManager.get_repeat_hotkey() or ""))
+        self.repeat_key_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.repeat_key_edit)
+        
+        save_btn = QPushButton("Save", self)
+        save_btn.clicked.connect(self.save_settings)
+        layout.addWidget(save_btn)
+        
+    def save_settings(self):
+        # Determine the key sequence string
+        seq = self.key_edit.keySequence().toString()
+        # Convert to a format friendly for 'keyboard' module if possible, 
+        # or just save as Qt string and let the main app handle conversion/warning.
+        # 'keyboard' module likes 'ctrl+shift+s', Qt gives 'Ctrl+Shift+S'.
+        # Usually case insensitive.
+        if seq:
+            ConfigManager.set_hotkey(seq)
+        # An empty sequence is saved too: it turns the repeat hotkey off
+        repeat_seq = self.repeat_key_edit.keySequence().toString()
+        ConfigManager.set_repeat_hotkey(repeat_seq or None)
+        self.accept()
@@ -1,11 +1,94 @@
+import uuid
+
 from PyQt6.QtWidgets import QWidget, QMenu, QApplication, QFileDialog, QPushButton, QLabel, QVBoxLayout, QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, QPoint, QRect, QEvent, QTimer
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, QSize, QEvent, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap, QAction, QPainter, QColor, QGuiApplication, QCursor, QKeySequence, QShortcut
 
+# Gap between a watch pin and the region it mirrors
+WATCH_GAP = 10
+# Let the window manager move the pin off its source before the first grab
+WATCH_START_DELAY_MS = 150
+
+
+class PinImageLabel(QLabel):
+    """
+    Draws the pin's pixmap scaled to the label, repainting only the dirty
+    rect so a watch pin can update a few tiles without rescaling the whole
+    image. Holds the same QPixmap object as the widget, so painting into
+    the widget's pixmap and calling update_source_rects() is enough. The
+    pixmap is never handed to QLabel, which would keep a second copy once
+    the widget's pixmap detaches on the first tile update.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.source = QPixmap()
+
+    def setPixmap(self, pixmap):
+        self.source = pixmap
+        self.updateGeometry()
+        self.update()
+
+    def clear(self):
+        self.source = QPixmap()
+        self.update()
+
+    def sizeHint(self):
+        return self.source.size() if not self.source.isNull() else QSize(0, 0)
+
+    def update_source_rects(self, rects):
+        """Schedule a repaint of the label area showing these pixmap rects."""
+        if self.source.isNull():
+            return
+        sx = self.width() / self.source.width()
+        sy = self.height() / self.source.height()
+        for r in rects:
+            # Pad a pixel for smooth-scaling bleed across tile edges
+            self.update(QRect(int(r.x() * sx) - 1, int(r.y() * sy) - 1,
+                              int(r.width() * sx) + 3, int(r.height() * sy) + 3))
+
+    def paintEvent(self, event):
+        if self.source.isNull() or self.width() == 0 or self.height() == 0:
+            return
+        dirty = event.rect()
+        sx = self.source.width() / self.width()
+        sy = self.source.height() / self.height()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(QRectF(dirty), self.source,
+                           QRectF(dirty.x() * sx, dirty.y() * sy, dirty.width() * sx, dirty.height() * sy))
+
+
 class FloatingWidget(QWidget):
-    def __init__(self, pixmap: QPixmap, geometry: QRect = None):
+    # Emitted with the widget itself so listeners don't need closures
+    pin_changed = pyqtSignal(object)
+    closed = pyqtSignal(object)
+    # (self, other pin or None for the live screen)
+    compare_requested = pyqtSignal(object, object)
+    # Restored pin showing a thumbnail was hovered; decode the full image
+    image_wanted = pyqtSignal(object)
+    # The pixmap was swapped outside the session loader (sync decode, new watch frame)
+    pixmap_replaced = pyqtSignal(object)
+
+    def __init__(self, pixmap: QPixmap, geometry: QRect = None, pin_id: str = None, source_rect: QRect = None,
+                 min_size: QSize = None):
         super().__init__()
         self.original_pixmap = pixmap
+        self.pin_id = pin_id or uuid.uuid4().hex
+        # Set when showing a restored thumbnail until the full image is decoded
+        self.pending_image_path = None
+        self.placed = False
+        # Screen area the pixels came from, for comparing against the live
+        # screen and watching; None for pins that aren't screen captures
+        self.source_rect = QRect(source_rect) if source_rect else None
+        # Callable returning the other pins this one can be compared with
+        self.compare_peers = None
+        # Image size the pin can't be shrunk below: the original capture size,
+        # which a restored (possibly enlarged) geometry doesn't tell us
+        self.min_size = QSize(min_size) if min_size else (geometry.size() if geometry else pixmap.size())
+        # Live-updating mode (see watch_pin.PinWatcher)
+        self.watching = False
+        self.watcher = None
         
         # Window setup
         self.setWindowFlags(
@@ -33,19 +116,13 @@ class FloatingWidget(QWidget):
         self.layout.setContentsMargins(20, 20, 20, 20) # Margins for shadow
         
         # Image Label
-        self.image_label = QLabel(self)
+        self.image_label = PinImageLabel(self)
         self.image_label.setPixmap(pixmap)
-        self.image_label.setScaledContents(True)
         # Mouse tracking on label too so events pass through or we handle them on parent
         self.image_label.setMouseTracking(True)
         self.image_label.installEventFilter(self)
         
-        # Shadow Effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 180))
-        shadow.setOffset(0, 5)
-        self.image_label.setGraphicsEffect(shadow)
+        self.apply_shadow()
         
         self.layout.addWidget(self.image_label)
         
@@ -97,12 +174,17 @@ class FloatingWidget(QWidget):
         # Delayed initialization
         QTimer.singleShot(100, self.apply_geometry_and_raise)
 
+    def apply_shadow(self):
+        shadow = QGraphicsDropShadowEffect(self)
+        shadow.setBlurRadius(20)
+        shadow.setColor(QColor(0, 0, 0, 180))
+        shadow.setOffset(0, 5)
+        self.image_label.setGraphicsEffect(shadow)
+
     def apply_geometry_and_raise(self):
         if self.target_geometry:
             print(f"DEBUG: Placing at {self.target_geometry}")
             self.setGeometry(self.target_geometry)
-            # Set minimum size to prevent shrinking below initial capture size
-            self.setMinimumSize(self.target_geometry.size())
         else:
             print("DEBUG: No geometry, centering")
             margins = self.layout.contentsMargins()
@@ -110,12 +192,119 @@ class FloatingWidget(QWidget):
             h = self.original_pixmap.height() + margins.top() + margins.bottom()
             self.resize(w, h)
             self.center_on_screen()
-             # Set minimum size to prevent shrinking below initial capture size
-            self.setMinimumSize(w, h)
 
+        # Prevent shrinking below the initial capture size
+        margins = self.layout.contentsMargins()
+        self.setMinimumSize(self.min_size.width() + margins.left() + margins.right(),
+                            self.min_size.height() + margins.top() + margins.bottom())
+
+        self.placed = True
         self.raise_()
         self.activateWindow()
 
+    def image_geometry(self):
+        """Global rect of the image itself, excluding the shadow margins."""
+        margins = self.layout.contentsMargins()
+        geo = self.geometry() if self.placed or not self.target_geometry else self.target_geometry
+        return geo.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
+
+    def current_opacity(self):
+        return self.windowOpacity()
+
+    def set_full_pixmap(self, pixmap):
+        self.original_pixmap = pixmap
+        self.image_label.setPixmap(pixmap)
+        self.pending_image_path = None
+
+    def ensure_full_pixmap(self):
+        # Decode synchronously if the user needs the pixels before the worker got to it
+        if self.pending_image_path:
+            self.set_full_pixmap(QPixmap(self.pending_image_path))
+            self.pixmap_replaced.emit(self)
+
+    def set_watching(self, enabled):
+        from watch_pin import PinWatcher, watch_supported
+
+        if enabled == self.watching or not self.source_rect:
+            return
+        if enabled and not watch_supported():
+            self.show_toast("Live update needs X11 capture")
+            return
+        self.watching = enabled
+        if enabled:
+            if self.watcher is None:
+                self.watcher = PinWatcher(self)
+            self.move_off_source()
+            # A graphics effect re-renders the whole label on any update,
+            # which would undo the tile-level repaints
+            self.image_label.setGraphicsEffect(None)
+            self.watcher.start(WATCH_START_DELAY_MS)
+        else:
+            self.watcher.stop()
+            self.apply_shadow()
+        self.pin_changed.emit(self)
+
+    def move_off_source(self):
+        """Move the pin beside its source region so it doesn't capture itself."""
+        image = self.image_geometry()
+        source = self.source_rect
+        if not image.intersects(source):
+            return
+        screen = QApplication.screenAt(source.center()) or QApplication.primaryScreen()
+        available = screen.availableGeometry()
+        candidates = [
+            QPoint(source.right() + 1 + WATCH_GAP, source.top()),
+            QPoint(source.left() - WATCH_GAP - image.width(), source.top()),
+            QPoint(source.left(), source.bottom() + 1 + WATCH_GAP),
+            QPoint(source.left(), source.top() - WATCH_GAP - image.height()),
+        ]
+        for top_left in candidates:
+            if available.contains(QRect(top_left, image.size())):
+                break
+        else:
+            print("DEBUG: No room beside the watched region; the pin may capture itself")
+            return
+
+        margins = self.layout.contentsMargins()
+        window_pos = top_left - QPoint(margins.left(), margins.top())
+        if self.placed:
+            self.move(window_pos)
+        else:
+            self.target_geometry.moveTopLeft(window_pos)
+
+    def apply_frame(self, image):
+        self.set_full_pixmap(QPixmap.fromImage(image))
+        self.pixmap_replaced.emit(self)
+
+    def apply_tiles(self, image, rects):
+        """Paint the changed tiles of a fresh grab into the pin and repaint just those."""
+        painter = QPainter(self.original_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        for r in rects:
+            painter.drawImage(r.topLeft(), image, r)
+        painter.end()
+        self.image_label.update_source_rects(rects)
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        if self.placed:
+            self.pin_changed.emit(self)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.placed:
+            self.pin_changed.emit(self)
+
+    def closeEvent(self, event):
+        if self.watcher:
+            self.watcher.stop()
+        self.closed.emit(self)
+        super().closeEvent(event)
+        if event.isAccepted():
+            # Drop the pixels now rather than whenever the wrapper is collected
+            self.image_label.clear()
+            self.original_pixmap = QPixmap()
+
     def center_on_screen(self):
         screen_geometry = QApplication.primaryScreen().geometry()
         x = (screen_geometry.width() - self.width()) // 2
@@ -125,6 +314,9 @@ class FloatingWidget(QWidget):
     def eventFilter(self, obj, event):
         if obj == self or obj == self.image_label:
             if event.type() == QEvent.Type.Enter:
+                # Synthetic enters (e.g. on show) don't count as the user looking
+                if self.pending_image_path and self.placed and self.geometry().contains(QCursor.pos()):
+                    self.image_wanted.emit(self)
                 self.close_btn.show()
                 self.update_close_btn_pos()
             elif event.type() == QEvent.Type.Leave:
@@ -248,6 +440,7 @@ class FloatingWidget(QWidget):
         else:
             val = max(0.2, val - 0.1)
         self.setWindowOpacity(val)
+        self.pin_changed.emit(self)
 
     def show_context_menu(self, pos):
         menu = QMenu(self)
@@ -260,6 +453,30 @@ class FloatingWidget(QWidget):
         copy_action.triggered.connect(self.copy_to_clipboard)
         menu.addAction(copy_action)
         
+        menu.addSeparator()
+        
+        if self.source_rect:
+            live_action = QAction("Compare with Live Screen", self)
+            live_action.triggered.connect(lambda: self.compare_requested.emit(self, None))
+            menu.addAction(live_action)
+            
+            watch_action = QAction("Watch (Live Update)", self)
+            watch_action.setCheckable(True)
+            watch_action.setChecked(self.watching)
+            watch_action.triggered.connect(self.set_watching)
+            menu.addAction(watch_action)
+        
+        peers = [p for p in (self.compare_peers() if self.compare_peers else []) if p is not self]
+        if peers:
+            compare_menu = menu.addMenu("Compare with Pin")
+            for i, peer in enumerate(peers, 1):
+                size = peer.original_pixmap.size()
+                action = QAction(f"Pin {i} ({size.width()}x{size.height()})", compare_menu)
+                action.triggered.connect(lambda checked=False, p=peer: self.compare_requested.emit(self, p))
+                compare_menu.addAction(action)
+        
+        menu.addSeparator()
+        
         close_action = QAction("Close", self)
         close_action.triggered.connect(self.close)
         menu.addAction(close_action)
@@ -267,11 +484,13 @@ class FloatingWidget(QWidget):
         menu.exec(pos)
 
     def save_image(self):
+        self.ensure_full_pixmap()
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Image", "", "PNG Files (*.png);;All Files (*)")
         if file_path:
             self.original_pixmap.save(file_path, "PNG")
 
     def copy_to_clipboard(self):
+        self.ensure_full_pixmap()
         clipboard = QGuiApplication.clipboard()
         clipboard.setPixmap(self.original_pixmap)
         self.show_toast("Copied!")
@@ -1,73 +1,124 @@
-from PIL import Image, ImageDraw
-import math
-
-def create_icon(path):
-    size = 256
-    # Create image
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # 1. Background: Rounded Rectangle with Purple Gradient
-    # Manually simulating gradient by drawing concentric shapes or just a solid cool purple for simplicity + slickness
-    # "Bora" means Purple. Let's use a rich violet/purple.
-    
-    # Modern "Squircle" shape
-    rect_margin = 16
-    rect_coords = [rect_margin, rect_margin, size - rect_margin, size - rect_margin]
-    corner_radius = 60
-    
-    # Base color: #8A2BE2 (BlueViolet) to #9400D3 (DarkViolet)
-    # Let's do a simple vertical gradient
-    for y in range(rect_margin, size - rect_margin):
-        # Calculate color interpolation
-        ratio = (y - rect_margin) / (size - 2 * rect_margin)
-        
-        # Color 1: #9B59B6 (Wisteria - Lighter Purple) -> (155, 89, 182)
-        # Color 2: #8E44AD (Wisteria - Darker Purple) -> (142, 68, 173)
-        # Taking a slightly more vibrant "Bora" gradient
-        # Top: #B15EFF (Neon Purple-ish) -> (177, 94, 255)
-        # Bot: #5D00B8 (Deep Purple) -> (93, 0, 184)
-        
-        r = int(177 + (93 - 177) * ratio)
-        g = int(94 + (0 - 94) * ratio)
-        b = int(255 + (184 - 255) * ratio)
-        
-        # Draw line limited by rounded rect mask?
-        # Simpler: just fill solid Deep Purple for now, gradients are hard to clip in pure PIL without numpy
-        # Let's stick to a nice solid vibrant purple
-        pass
-
-    # Draw solid rounded rectangle
-    purple_color = (138, 43, 226) # BlueViolet
-    draw.rounded_rectangle(rect_coords, radius=corner_radius, fill=purple_color)
-
-    # 2. Icon Symbol: Crop/Capture Frame
-    # White lines
-    stroke_width = 20
-    white = (255, 255, 255, 240)
-    
-    margin = 70
-    # Top-Left corner
-    draw.line([(margin, margin), (margin + 60, margin)], fill=white, width=stroke_width)
-    draw.line([(margin, margin - stroke_width/2), (margin, margin + 60)], fill=white, width=stroke_width)
-    
-    # Bottom-Right corner
-    draw.line([(size-margin-60, size-margin), (size-margin, size-margin)], fill=white, width=stroke_width)
-    draw.line([(size-margin, size-margin-60), (size-margin, size-margin+stroke_width/2)], fill=white, width=stroke_width)
-
-    # Center circle (Lens)
-    center = size // 2
-    radius = 35
-    draw.ellipse([center-radius, center-radius, center+radius, center+radius], outline=white, width=stroke_width)
-    
-    # Add a "Flash" dot
-    dot_radius = 6
-    dot_x = center + 15
-    dot_y = center - 15
-    # draw.ellipse([dot_x-dot_radius, dot_y-dot_radius, dot_x+dot_radius, dot_y+dot_radius], fill=white)
-
-    img.save(path)
-    print(f"Icon saved to {path}")
+import argparse
+import hashlib
+import os
+
+import numpy as np
+from PIL import Image
+
+# Everything below is drawn in a 256x256 design space and rasterised
+# directly at each target size, so small icons stay crisp instead of
+# being downscaled from one large bitmap.
+DESIGN_SIZE = 256.0
+
+# Full hicolor set installed for the desktop/tray, plus the About dialog image
+ICON_SIZES = [16, 22, 24, 32, 48, 64, 128, 256, 512]
+ABOUT_SIZE = 64
+APP_NAME = "bora"
+
+# "Bora" means purple: #B15EFF (top) to #5D00B8 (bottom)
+GRADIENT_TOP = np.array([177, 94, 255], dtype=np.float32)
+GRADIENT_BOTTOM = np.array([93, 0, 184], dtype=np.float32)
+GLYPH_ALPHA = 240 / 255
+
+RECT_MARGIN = 16
+CORNER_RADIUS = 60
+
+STROKE = 20
+MARGIN = 70
+ARM = 60
+LENS_RADIUS = 35
+
+STAMP_FILE = ".source-hash"
+
+
+def sd_box(x, y, x0, y0, x1, y1, radius=0.0):
+    """Signed distance to an (optionally rounded) axis-aligned box; negative inside."""
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    qx = np.abs(x - cx) - (x1 - x0) / 2 + radius
+    qy = np.abs(y - cy) - (y1 - y0) / 2 + radius
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    inside = np.minimum(np.maximum(qx, qy), 0)
+    return outside + inside - radius
+
+
+def render_icon(size):
+    """Rasterise the icon at `size` px into an (size, size, 4) uint8 RGBA array."""
+    scale = DESIGN_SIZE / size
+    # Pixel centres in design units
+    coords = (np.arange(size, dtype=np.float32) + 0.5) * scale
+    x, y = np.meshgrid(coords, coords)
+
+    # Squircle background with a vertical gradient
+    bg_dist = sd_box(x, y, RECT_MARGIN, RECT_MARGIN, DESIGN_SIZE - RECT_MARGIN, DESIGN_SIZE - RECT_MARGIN, CORNER_RADIUS)
+    ratio = np.clip((y - RECT_MARGIN) / (DESIGN_SIZE - 2 * RECT_MARGIN), 0, 1)[:, :, None]
+    bg_rgb = GRADIENT_TOP + (GRADIENT_BOTTOM - GRADIENT_TOP) * ratio
+
+    # Capture-frame glyph: two corner brackets and a lens ring
+    half = STROKE / 2
+    far = DESIGN_SIZE - MARGIN
+    center = DESIGN_SIZE / 2
+    glyph_dist = np.minimum.reduce([
+        sd_box(x, y, MARGIN, MARGIN - half, MARGIN + ARM, MARGIN + half),
+        sd_box(x, y, MARGIN - half, MARGIN - half, MARGIN + half, MARGIN + ARM),
+        sd_box(x, y, far - ARM, far - half, far, far + half),
+        sd_box(x, y, far - half, far - ARM, far + half, far + half),
+        np.abs(np.hypot(x - center, y - center) - (LENS_RADIUS - half)) - half,
+    ])
+
+    # Convert distances to pixel coverage for one-pixel anti-aliasing
+    bg_a = np.clip(0.5 - bg_dist / scale, 0, 1)[:, :, None]
+    glyph_a = (np.clip(0.5 - glyph_dist / scale, 0, 1) * GLYPH_ALPHA)[:, :, None]
+
+    # White glyph composited over the background
+    out_a = glyph_a + bg_a * (1 - glyph_a)
+    out_rgb = (255 * glyph_a + bg_rgb * bg_a * (1 - glyph_a)) / np.maximum(out_a, 1e-6)
+    rgba = np.concatenate([out_rgb, out_a * 255], axis=2)
+    return np.round(rgba).astype(np.uint8)
+
+
+def icon_path(out_dir, size):
+    return os.path.join(out_dir, "icons", "hicolor", f"{size}x{size}", "apps", f"{APP_NAME}.png")
+
+
+def output_paths(out_dir):
+    paths = [icon_path(out_dir, s) for s in ICON_SIZES]
+    paths += [os.path.join(out_dir, "icon.png"), os.path.join(out_dir, "about.png")]
+    return paths
+
+
+def source_hash():
+    # Any change to this script (shapes, colours, sizes) invalidates the assets
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def generate_assets(out_dir="assets", force=False):
+    stamp_path = os.path.join(out_dir, "icons", STAMP_FILE)
+    digest = source_hash()
+    if not force and os.path.exists(stamp_path) and all(os.path.exists(p) for p in output_paths(out_dir)):
+        with open(stamp_path) as f:
+            if f.read().strip() == digest:
+                print("Icons are up to date.")
+                return False
+
+    for size in ICON_SIZES:
+        path = icon_path(out_dir, size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Image.fromarray(render_icon(size), 'RGBA').save(path)
+
+    # Legacy single icon (used by the source-tree .desktop entry) and the About image
+    Image.fromarray(render_icon(256), 'RGBA').save(os.path.join(out_dir, "icon.png"))
+    Image.fromarray(render_icon(ABOUT_SIZE), 'RGBA').save(os.path.join(out_dir, "about.png"))
+
+    with open(stamp_path, 'w') as f:
+        f.write(digest + "\n")
+    print(f"Icons saved to {out_dir} ({', '.join(map(str, ICON_SIZES))} px + About)")
+    return True
+
 
 if __name__ == "__main__":
-    create_icon("assets/icon.png")
+    parser = argparse.ArgumentParser(description="Render Bora's icon set")
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets"))
+    parser.add_argument('--force', action='store_true', help="regenerate even if sources are unchanged")
+    args = parser.parse_args()
+    generate_assets(args.out, args.force)
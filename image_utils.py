@@ -0,0 +1,19 @@
+import numpy as np
+from PyQt6.QtGui import QImage
+
+
+def qimage_to_array(image):
+    """Copy a QImage into an (h, w, 4) uint8 array in BGRA byte order."""
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    w, h = image.width(), image.height()
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    rows = np.frombuffer(ptr, np.uint8).reshape(h, image.bytesPerLine())
+    return rows[:, :w * 4].reshape(h, w, 4).copy()
+
+
+def array_to_qimage(arr):
+    """Wrap an (h, w, 4) BGRA uint8 array as a QImage that owns its pixels."""
+    arr = np.ascontiguousarray(arr, dtype=np.uint8)
+    h, w = arr.shape[:2]
+    return QImage(arr.data, w, h, w * 4, QImage.Format.Format_ARGB32).copy()
@@ -9,7 +9,6 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 APP_NAME="bora"
 DESKTOP_FILE="$SCRIPT_DIR/bora.desktop"
-ICON_FILE="$SCRIPT_DIR/assets/icon.png"
 
 echo "==================================="
 echo "  Bora - Screen Capture Tool"
@@ -77,6 +76,12 @@ if ! groups $USER | grep &>/dev/null 'input'; then
     echo "주의: 그룹 변경 사항을 적용하려면 로그아웃 후 다시 로그인해야 할 수 있습니다."
 fi
 
+# 아이콘 생성 및 설치 (generate_icon.py가 바뀌지 않았으면 생성은 건너뜀)
+python3 "$SCRIPT_DIR/generate_icon.py"
+mkdir -p ~/.local/share/icons
+cp -r "$SCRIPT_DIR/assets/icons/hicolor" ~/.local/share/icons/
+gtk-update-icon-cache -q ~/.local/share/icons/hicolor 2>/dev/null || true
+
 # .desktop 파일 경로 업데이트
 echo
 echo "[3/4] 데스크톱 엔트리 생성 중..."
@@ -89,7 +94,7 @@ Name[ko]=보라
 Comment=Screen Capture Utility
 Comment[ko]=화면 캡처 유틸리티
 Exec=python3 $SCRIPT_DIR/main.py
-Icon=$ICON_FILE
+Icon=$APP_NAME
 Terminal=false
 Type=Application
 Categories=Utility;Graphics;
@@ -0,0 +1,92 @@
+import json
+import os
+import socket
+import tempfile
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QLocalServer
+
+SOCKET_PATH = os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir()),
+    f"bora-{os.getuid()}.sock"
+)
+# Seconds to wait for a reply before giving up on the running instance
+DEFAULT_TIMEOUT = 30
+
+
+class IpcServer(QObject):
+    """
+    Line-based JSON command channel for the running instance.
+
+    A request is {"command": name, "args": {...}}; handlers are called as
+    handler(args, reply) and may call reply(dict) later, e.g. once a long
+    job finishes. Each connection carries one request and one reply.
+    """
+
+    def __init__(self, parent=None, path=SOCKET_PATH):
+        super().__init__(parent)
+        self.path = path
+        self.handlers = {}
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def register(self, command, handler):
+        self.handlers[command] = handler
+
+    def start(self):
+        # A stale socket from a crashed instance would block listen()
+        QLocalServer.removeServer(self.path)
+        # Owner-only: the channel can grab the screen and write files, and
+        # without XDG_RUNTIME_DIR the socket sits at a predictable /tmp path
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        if not self.server.listen(self.path):
+            print(f"IPC server failed to listen on {self.path}: {self.server.errorString()}")
+            return False
+        print(f"IPC server listening on {self.path}")
+        return True
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            conn.setProperty('buffer', b'')
+            conn.readyRead.connect(lambda c=conn: self.on_ready_read(c))
+            conn.disconnected.connect(conn.deleteLater)
+
+    def on_ready_read(self, conn):
+        buffer = conn.property('buffer') + bytes(conn.readAll())
+        if b'\n' not in buffer:
+            conn.setProperty('buffer', buffer)
+            return
+        line = buffer.split(b'\n', 1)[0]
+
+        def reply(payload):
+            if conn.state() == conn.LocalSocketState.ConnectedState:
+                conn.write(json.dumps(payload).encode() + b'\n')
+                conn.disconnectFromServer()
+
+        try:
+            request = json.loads(line)
+            handler = self.handlers.get(request.get('command'))
+            if not handler:
+                reply({'ok': False, 'error': f"unknown command: {request.get('command')}"})
+                return
+            handler(request.get('args') or {}, reply)
+        except Exception as e:
+            reply({'ok': False, 'error': str(e)})
+
+
+def send_command(command, args=None, timeout=DEFAULT_TIMEOUT, path=SOCKET_PATH):
+    """Send one command to the running instance and return its JSON reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(json.dumps({'command': command, 'args': args or {}}).encode() + b'\n')
+        data = b''
+        while not data.endswith(b'\n'):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    if not data:
+        raise ConnectionError("Bora closed the connection without replying")
+    return json.loads(data)
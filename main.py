@@ -1,87 +1,67 @@
 import sys
 import os
+import argparse
+import json
+import importlib
+import multiprocessing
+import threading
+import time
+
+from startup_profile import profiler
 
 # Force XCB (X11) backend to bypass strict Wayland window placement restrictions
 # This allows 'Always on Top' and programmatic positioning to work correctly.
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QDialog, QVBoxLayout, QLabel, QPushButton, QKeySequenceEdit
-from PyQt6.QtGui import QIcon, QAction, QKeySequence, QPixmap
-from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QFileDialog, QInputDialog, QMessageBox
+from PyQt6.QtGui import QIcon, QAction, QPixmap, QGuiApplication
+from PyQt6.QtCore import QObject, QRect, QPoint, QSize, QTimer, pyqtSignal
 
-from snipper import Snipper
-from floating_widget import FloatingWidget
+# Only the tray, hotkey and IPC path is imported up front. Capture, pins,
+# diffing, export and the dialogs are imported where they are first used,
+# and warm_up() preloads the heavy ones once the event loop is running.
+from session_store import SessionStore
+from ipc import IpcServer
+from memory_stats import MemoryTracker, pixmap_bytes, format_bytes
+import ipc
 from config_manager import ConfigManager
 
-class AboutDialog(QDialog):
-    def __init__(self, icon_path, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("About Bora")
-        self.setFixedSize(300, 200)
-        
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Icon
-        icon_label = QLabel(self)
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            # Scale it nicely
-            pixmap = pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            icon_label.setPixmap(pixmap)
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(icon_label)
-        
-        # Title
-        title = QLabel("Bora", self)
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
-        
-        # Copyright
-        copyright = QLabel("(C) 2025 DINKI'ssTyle", self)
-        copyright.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(copyright)
-
-class SettingsDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Settings")
-        self.setFixedSize(300, 150)
-        
-        layout = QVBoxLayout(self)
-        
-        layout.addWidget(QLabel("Capture Hotkey:"))
-        
-        self.key_edit = QKeySequenceEdit(self)
-        current_hotkey = ConfigManager.get_hotkey()
-        self.key_edit.setKeySequence(QKeySequence(current_hotkey))
-        layout.addWidget(self.key_edit)
-        
-        save_btn = QPushButton("Save", self)
-        save_btn.clicked.connect(self.save_settings)
-        layout.addWidget(save_btn)
-        
-    def save_settings(self):
-        # Determine the key sequence string
-        seq = self.key_edit.keySequence().toString()
-        # Convert to a format friendly for 'keyboard' module if possible, 
-        # or just save as Qt string and let the main app handle conversion/warning.
-        # 'keyboard' module likes 'ctrl+shift+s', Qt gives 'Ctrl+Shift+S'.
-        # Usually case insensitive.
-        if seq:
-            ConfigManager.set_hotkey(seq)
-        self.accept()
+profiler.mark("Qt and core imports")
+
+# The export reply only arrives once every image is written
+EXPORT_TIMEOUT = 600
+
+# Pure-Python/NumPy modules safe to import off the GUI thread
+PRELOAD_MODULES = ['numpy', 'image_utils', 'visual_diff', 'batch_export', 'watch_pin']
 
 class BoraUbuntu(QObject):
+    # Emitted from the preload thread when PRELOAD_MODULES are imported
+    preloaded = pyqtSignal(float)
+
     def __init__(self):
         super().__init__()
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
+        profiler.mark("QApplication")
         
         # Keep track of windows to prevent GC
         self.floating_windows = []
         self.snipper = None
+        self.memory = MemoryTracker()
+        # Most recent Snipper selections (global rects), newest first
+        self.recent_regions = [QRect(*r) for r in ConfigManager.get('recent_regions', [])]
+        # Shared per-screen overlays used instead of one window per pin
+        self.pin_boards = None
+
+        # Pins survive restarts; restored lazily in run()
+        self.session = SessionStore(self)
+        self.session.image_loaded.connect(self.on_session_image_loaded)
+        self.app.aboutToQuit.connect(self.session.shutdown)
+        self.app.commitDataRequest.connect(self.on_commit_data)
+        self.preloaded.connect(lambda start: profiler.done("preload NumPy/diff/export (background)", start))
+        # Restored watch pins wait for the preload so NumPy isn't imported on the GUI thread
+        self.restored_watch_pins = []
+        self.preloaded.connect(self.start_restored_watches)
 
         # Setup Tray Icon
         self.tray_icon = QSystemTrayIcon(self.app)
@@ -94,6 +74,24 @@ class BoraUbuntu(QObject):
         self.capture_action.triggered.connect(self.start_capture)
         self.menu.addAction(self.capture_action)
         
+        self.repeat_menu = self.menu.addMenu("Repeat Region")
+        self.menu.aboutToShow.connect(self.update_repeat_menu)
+        
+        self.pin_board_action = QAction("Pin Board Mode", self)
+        self.pin_board_action.setCheckable(True)
+        self.pin_board_action.setChecked(ConfigManager.get('pin_board_mode', False))
+        self.pin_board_action.toggled.connect(self.set_pin_board_mode)
+        self.menu.addAction(self.pin_board_action)
+        
+        self.export_action = QAction("Export All Pins...", self)
+        self.export_action.triggered.connect(self.open_export)
+        self.menu.addAction(self.export_action)
+        
+        self.memory_action = QAction("Memory: -", self)
+        self.memory_action.triggered.connect(self.show_memory_details)
+        self.menu.addAction(self.memory_action)
+        self.menu.aboutToShow.connect(self.update_memory_action)
+        
         self.settings_action = QAction("Settings", self)
         self.settings_action.triggered.connect(self.open_settings)
         self.menu.addAction(self.settings_action)
@@ -107,16 +105,25 @@ class BoraUbuntu(QObject):
         self.menu.addSeparator()
         
         self.quit_action = QAction("Quit", self)
-        self.quit_action.triggered.connect(self.app.quit)
+        self.quit_action.triggered.connect(self.quit)
         self.menu.addAction(self.quit_action)
         
         self.tray_icon.setContextMenu(self.menu)
         self.tray_icon.show()
+        profiler.mark("tray icon and menu")
+        
+        # Commands from `main.py --export ...` and other scripts
+        self.ipc_server = IpcServer(self)
+        self.ipc_server.register('export', self.handle_export_command)
+        self.ipc_server.register('repeat-region', self.handle_repeat_command)
+        self.ipc_server.register('memory', lambda args, reply: reply({'ok': True, **self.sample_memory()}))
+        self.exporter = None
         
     def resource_path(self, relative_path):
         """ Get absolute path to resource, works for dev and for PyInstaller """
         try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
+            # PyInstaller stores the bundle's data dir in _MEIPASS (the install
+            # dir for one-dir builds, a temp folder for onefile ones)
             base_path = sys._MEIPASS
         except Exception:
             base_path = os.path.dirname(os.path.abspath(__file__))
@@ -127,54 +134,378 @@ class BoraUbuntu(QObject):
         # Try to load local icon, fallback to system icon
         # Use resource_path to correctly locate assets in both dev and built versions
         icon_path = self.resource_path(os.path.join('assets', 'icon.png'))
+        hicolor_dir = self.resource_path(os.path.join('assets', 'icons', 'hicolor'))
         
-        print(f"DEBUG: Loading icon from {icon_path}") # Debug print
+        print(f"DEBUG: Loading icon from {hicolor_dir}") # Debug print
         
-        if os.path.exists(icon_path):
+        if os.path.isdir(hicolor_dir):
+            # Register every pre-rendered size so Qt picks one instead of rescaling
+            icon = QIcon()
+            for size_dir in os.listdir(hicolor_dir):
+                path = os.path.join(hicolor_dir, size_dir, 'apps', 'bora.png')
+                if os.path.exists(path):
+                    icon.addFile(path)
+            self.tray_icon.setIcon(icon)
+        elif os.path.exists(icon_path):
             self.tray_icon.setIcon(QIcon(icon_path))
         else:
             print(f"DEBUG: Icon not found at {icon_path}, using fallback.")
             # Fallback
             self.tray_icon.setIcon(QIcon.fromTheme("camera-photo"))
 
+    def prepare_snipper(self):
+        # Created once and reused, so a capture is just a grab plus show()
+        if self.snipper is None:
+            from snipper import Snipper
+            self.snipper = Snipper()
+            self.snipper.capture_signal.connect(self.remember_region)
+            self.snipper.capture_signal.connect(self.create_floating_window)
+
     def start_capture(self):
-        # Create snipper
-        # We need to make sure previous snipper is gone or reused
-        if self.snipper:
-            self.snipper.close()
+        self.prepare_snipper()
+        if self.snipper.is_active():
+            # Hotkey pressed again mid-selection: start over with a fresh frame
+            self.snipper.finish()
         
-        self.snipper = Snipper()
-        self.snipper.capture_signal.connect(self.create_floating_window)
-        # Snipper shows itself in its __init__ (which is a bit aggressive but fine for now)
+        if self.snipper.start():
+            self.sample_memory()
+
+    def remember_region(self, pixmap, rect):
+        limit = ConfigManager.get('recent_regions_max', 5)
+        self.recent_regions = [rect] + [r for r in self.recent_regions if r != rect]
+        self.recent_regions = self.recent_regions[:limit]
+        ConfigManager.set('recent_regions', [[r.x(), r.y(), r.width(), r.height()] for r in self.recent_regions])
+
+    def update_repeat_menu(self):
+        self.repeat_menu.clear()
+        self.repeat_menu.setEnabled(bool(self.recent_regions))
+        for i, rect in enumerate(self.recent_regions):
+            action = QAction(f"{rect.width()}x{rect.height()} at ({rect.x()}, {rect.y()})", self.repeat_menu)
+            action.triggered.connect(lambda checked=False, index=i: self.repeat_region(index))
+            self.repeat_menu.addAction(action)
+
+    def repeat_region(self, index=0, mode='pin', reply=None):
+        """Grab a remembered region straight from the capture backend, no overlay."""
+        if index >= len(self.recent_regions):
+            message = "No remembered region to repeat"
+            if reply:
+                reply({'ok': False, 'error': message})
+            else:
+                self.tray_icon.showMessage("Bora", message)
+            return
+        rect = QRect(self.recent_regions[index])
+
+        def done(image):
+            if image is None:
+                if reply:
+                    reply({'ok': False, 'error': "capture failed"})
+                else:
+                    self.tray_icon.showMessage("Bora", "Could not capture the remembered region")
+                return
+            pixmap = QPixmap.fromImage(image)
+            if mode == 'copy':
+                QGuiApplication.clipboard().setPixmap(pixmap)
+                self.tray_icon.showMessage("Bora", "Region copied to clipboard")
+            else:
+                self.create_floating_window(pixmap, rect)
+            if reply:
+                reply({'ok': True, 'mode': mode, 'rect': [rect.x(), rect.y(), rect.width(), rect.height()]})
+
+        self.grab_region_async(rect, done)
 
-    def create_floating_window(self, pixmap, rect):
+    def handle_repeat_command(self, args, reply):
+        mode = args.get('mode', 'pin')
+        if mode not in ('pin', 'copy'):
+            reply({'ok': False, 'error': f"unknown mode: {mode}"})
+            return
+        try:
+            index = int(args.get('index', 0))
+        except (TypeError, ValueError):
+            index = -1
+        if index < 0:
+            reply({'ok': False, 'error': f"invalid index: {args.get('index')}"})
+            return
+        self.repeat_region(index, mode, reply)
+
+    def grab_region_async(self, rect, callback):
+        """
+        Grab a global rect and call callback(QImage, or None on failure).
+        Pins covering the rect are hidden briefly so they don't end up in it.
+        """
+        import capture_backends
+
+        windows = list(self.floating_windows)
+        if self.pin_boards:
+            windows += list(self.pin_boards.boards.values())
+        covering = [w for w in windows if w.isVisible() and w.frameGeometry().intersects(rect)]
+        for w in covering:
+            w.hide()
+
+        def grab():
+            try:
+                image = capture_backends.grab(rect)
+            except Exception as e:
+                print(f"ERROR: Failed to grab region: {e}")
+                image = None
+            finally:
+                for w in covering:
+                    try:
+                        w.show()
+                    except RuntimeError:
+                        pass  # Closed while hidden
+            callback(image)
+
+        if covering:
+            # Give the compositor a moment to unmap them
+            QTimer.singleShot(150, grab)
+        else:
+            grab()
+
+    def create_floating_window(self, pixmap, rect, from_screen=True):
         print("DEBUG: create_floating_window called")
+        cap_mb = ConfigManager.get('memory_cap_mb', 0)
+        if cap_mb:
+            pin_bytes = self.sample_memory()['pin_bytes']
+            if pin_bytes + pixmap_bytes(pixmap) > cap_mb * 1024 * 1024:
+                self.tray_icon.showMessage(
+                    "Bora",
+                    f"Memory cap of {cap_mb} MB reached ({format_bytes(pin_bytes)} pinned). Close some pins first."
+                )
+                return
+        # Screen captures can later be compared with or watch the same area
+        pin = self.add_pin(pixmap, rect, source_rect=rect if from_screen else None)
+        if pin:
+            self.session.track(pin)
+            self.sample_memory()
+
+    def add_pin(self, pixmap, rect, pin_id=None, source_rect=None, min_size=None):
+        if ConfigManager.get('pin_board_mode', False):
+            # All pins share one overlay surface per screen
+            if self.pin_boards is None:
+                from pin_board import PinBoardManager
+                self.pin_boards = PinBoardManager(self)
+                self.pin_boards.pin_changed.connect(self.session.mark_dirty)
+                self.pin_boards.pin_closed.connect(self.session.untrack)
+                self.pin_boards.compare_peers = self.all_pins
+                self.pin_boards.compare_requested.connect(self.compare_pins)
+            return self.pin_boards.add_pin(pixmap, rect, pin_id, source_rect, min_size)
         try:
-            fw = FloatingWidget(pixmap, rect)
-            # When window closes, remove from list ??
-            # For now just keep them appended. In a long running app, we'd want to cleanup.
-            # Let's add a cleanup hook
-            fw.destroyed.connect(lambda: self.cleanup_window(fw))
+            from floating_widget import FloatingWidget
+            fw = FloatingWidget(pixmap, rect, pin_id, source_rect, min_size)
+            fw.image_wanted.connect(lambda pin: self.session.request_full_image(pin.pin_id))
+            # Keep the peak honest when a pin's pixels are swapped later
+            fw.pixmap_replaced.connect(lambda pin: self.sample_memory())
+            # Drop our reference on close; WA_DeleteOnClose frees the widget
+            fw.closed.connect(self.cleanup_window)
+            fw.pin_changed.connect(self.session.mark_dirty)
+            fw.closed.connect(self.session.untrack)
+            fw.compare_peers = self.all_pins
+            fw.compare_requested.connect(self.compare_pins)
             self.floating_windows.append(fw)
             fw.show()
             print("DEBUG: FloatingWidget created and shown")
+            return fw
         except Exception as e:
             print(f"ERROR: Failed to create floating window: {e}")
             import traceback
             traceback.print_exc()
+            return None
+
+    def all_pins(self):
+        pins = list(self.floating_windows)
+        if self.pin_boards:
+            pins += self.pin_boards.pins()
+        return pins
+
+    def restore_session(self):
+        # Show thumbnails right away; full-resolution images decode on a worker
+        for entry in self.session.load_entries():
+            pin_id = entry['id']
+            thumb_path = self.session.thumbnail_path(pin_id)
+            image_path = self.session.image_path(pin_id)
+            placeholder = QPixmap(thumb_path if os.path.exists(thumb_path) else image_path)
+            source = entry.get('source')
+            min_size = entry.get('min_size')
+            pin = self.add_pin(placeholder, QRect(*entry['geometry']), pin_id,
+                               QRect(*source) if source else None, QSize(*min_size) if min_size else None)
+            if not pin:
+                continue
+            pin.pending_image_path = image_path
+            if pin in self.floating_windows:
+                pin.setWindowOpacity(entry.get('opacity', 1.0))
+                if entry.get('watch'):
+                    self.restored_watch_pins.append(pin)
+            else:
+                pin.opacity = entry.get('opacity', 1.0)
+                if entry.get('watch'):
+                    print("DEBUG: Watch pins restore as static images in pin board mode")
+            self.session.track(pin, saved=True)
+            # Hovering a pin decodes it right away; the rest trickle in
+            self.session.queue_full_image(pin_id)
+        
+    def start_restored_watches(self):
+        for pin in self.restored_watch_pins:
+            try:
+                pin.set_watching(True)
+            except RuntimeError:
+                pass  # Closed before the preload finished
+        self.restored_watch_pins = []
+
+    def on_session_image_loaded(self, pin_id, image):
+        for pin in self.all_pins():
+            if pin.pin_id == pin_id and pin.pending_image_path:
+                pin.set_full_pixmap(QPixmap.fromImage(image))
+                if self.pin_boards and pin not in self.floating_windows:
+                    self.pin_boards.refresh_pin(pin)
+                self.sample_memory()
+                break
+
+    def compare_pins(self, pin, other):
+        pin.ensure_full_pixmap()
+        anchor = pin.image_geometry()
+        before = pin.original_pixmap.toImage()
+        if other is None:
+            def compare_live(live):
+                if live is None:
+                    self.tray_icon.showMessage("Bora", "Could not capture the screen to compare with")
+                    return
+                self.start_diff(anchor, before, live)
+
+            self.grab_region_async(pin.source_rect, compare_live)
+            return
+        other.ensure_full_pixmap()
+        self.start_diff(anchor, other.original_pixmap.toImage(), before)
+
+    def start_diff(self, anchor, before, after):
+        from visual_diff import DiffWorker, DEFAULT_TOLERANCE
+
+        tolerance = ConfigManager.get('diff_tolerance', DEFAULT_TOLERANCE)
+        worker = DiffWorker(before, after, tolerance, self)
+        worker.finished.connect(lambda result: self.show_diff_result(worker, anchor, result))
+        worker.failed.connect(lambda error: self.on_diff_failed(worker, error))
+        worker.start()
+
+    def on_diff_failed(self, worker, error):
+        worker.deleteLater()
+        print(f"ERROR: Diff failed: {error}")
+        self.tray_icon.showMessage("Bora", f"Comparison failed: {error}")
+
+    def show_diff_result(self, worker, anchor, result):
+        worker.deleteLater()
+        # Pin the highlight overlay slightly offset from the compared pin
+        rect = QRect(anchor.topLeft() + QPoint(30, 30), result.overlay.size())
+        self.create_floating_window(QPixmap.fromImage(result.overlay), rect, from_screen=False)
+        self.tray_icon.showMessage(
+            "Bora",
+            f"{len(result.boxes)} changed region(s), {result.changed_ratio:.1%} of pixels"
+        )
+
+    def open_export(self):
+        from batch_export import FORMATS
+
+        out_dir = QFileDialog.getExistingDirectory(None, "Export Pins To")
+        if not out_dir:
+            return
+        fmt, ok = QInputDialog.getItem(None, "Export Format", "Format:", list(FORMATS), 0, False)
+        if ok:
+            self.export_pins(out_dir, fmt)
+
+    def handle_export_command(self, args, reply):
+        if 'directory' not in args:
+            reply({'ok': False, 'error': "missing 'directory'"})
+            return
+        self.export_pins(os.path.expanduser(args['directory']), args.get('format', 'png'), reply)
+
+    def export_pins(self, out_dir, fmt, reply=None):
+        from batch_export import BatchExporter, FORMATS
+
+        if self.exporter:
+            message = "An export is already running"
+            if reply:
+                reply({'ok': False, 'error': message})
+            else:
+                self.tray_icon.showMessage("Bora", message)
+            return
+        if fmt not in FORMATS:
+            if reply:
+                reply({'ok': False, 'error': f"unsupported format: {fmt}"})
+            return
+
+        items = []
+        for i, pin in enumerate(self.all_pins(), 1):
+            name = f"bora_pin_{i:03d}_{pin.pin_id[:8]}"
+            if pin.pending_image_path:
+                # Restored pin not decoded yet: let the pool read the saved file
+                items.append((name, pin.pending_image_path))
+            else:
+                # Raster-backed pixmaps share their pixels with the QImage
+                items.append((name, pin.original_pixmap.toImage()))
+
+        self.exporter = BatchExporter(items, out_dir, fmt, max_in_flight_mb=ConfigManager.get('export_in_flight_mb'),
+                                      parent=self)
+        self.exporter.finished.connect(lambda report: self.on_export_finished(report, reply))
+        self.exporter.start()
+
+    def on_export_finished(self, report, reply):
+        self.exporter.deleteLater()
+        self.exporter = None
+        print(f"Export finished: {report}")
+        if reply:
+            reply(report)
+        else:
+            self.tray_icon.showMessage(
+                "Bora",
+                f"Exported {report['exported']} pin(s) in {report['seconds']}s "
+                f"({report['images_per_second']} images/s, {report['megapixels_per_second']} MP/s)"
+            )
+
+    def sample_memory(self):
+        capture = self.snipper.pixmaps() if self.snipper else []
+        return self.memory.sample(self.all_pins(), capture)
+
+    def update_memory_action(self):
+        stats = self.sample_memory()
+        self.memory_action.setText(
+            f"Memory: {format_bytes(stats['total_bytes'])} "
+            f"({len(stats['pins'])} pins, peak {format_bytes(stats['peak_bytes'])})"
+        )
+
+    def show_memory_details(self):
+        stats = self.sample_memory()
+        lines = [f"{p['width']}x{p['height']}  {format_bytes(p['bytes'])}" for p in stats['pins']]
+        lines += [
+            "",
+            f"Pins: {format_bytes(stats['pin_bytes'])}",
+            f"Capture frame: {format_bytes(stats['capture_bytes'])}",
+            f"Peak since start: {format_bytes(stats['peak_bytes'])}",
+        ]
+        cap_mb = ConfigManager.get('memory_cap_mb', 0)
+        if cap_mb:
+            lines.append(f"Cap: {cap_mb} MB")
+        QMessageBox.information(None, "Bora Memory", "\n".join(lines))
 
     def cleanup_window(self, window):
         if window in self.floating_windows:
             self.floating_windows.remove(window)
 
+    def set_pin_board_mode(self, enabled):
+        # Only affects new pins; existing ones keep their current surface
+        ConfigManager.set('pin_board_mode', enabled)
+
     def open_settings(self):
+        from dialogs import SettingsDialog
+
         dlg = SettingsDialog()
         if dlg.exec():
             # Reload hotkeys
             self.setup_hotkeys()
 
     def open_about(self):
-        icon_path = self.resource_path(os.path.join('assets', 'icon.png'))
+        from dialogs import AboutDialog
+
+        icon_path = self.resource_path(os.path.join('assets', 'about.png'))
+        if not os.path.exists(icon_path):
+            icon_path = self.resource_path(os.path.join('assets', 'icon.png'))
         dlg = AboutDialog(icon_path, None)
         dlg.exec()
 
@@ -185,12 +516,21 @@ class BoraUbuntu(QObject):
             # Stop existing listener if any
             if hasattr(self, 'hotkey_listener') and self.hotkey_listener:
                 self.hotkey_listener.stop()
+            if hasattr(self, 'repeat_hotkey_listener') and self.repeat_hotkey_listener:
+                self.repeat_hotkey_listener.stop()
+                self.repeat_hotkey_listener = None
             
             hotkey = ConfigManager.get_hotkey()
             self.hotkey_listener = HotkeyListener(hotkey, self.start_capture_safe)
             self.hotkey_listener.start()
             
             print(f"Hotkey listener started for: {hotkey}")
+            
+            repeat_hotkey = ConfigManager.get_repeat_hotkey()
+            if repeat_hotkey:
+                self.repeat_hotkey_listener = HotkeyListener(repeat_hotkey, self.repeat_region_safe)
+                self.repeat_hotkey_listener.start()
+                print(f"Repeat hotkey listener started for: {repeat_hotkey}")
         except Exception as e:
             print(f"Failed to setup hotkeys: {e}")
 
@@ -200,8 +540,67 @@ class BoraUbuntu(QObject):
         from PyQt6.QtCore import QTimer
         QTimer.singleShot(0, self.start_capture)
 
+    def repeat_region_safe(self):
+        # Same thread hop as start_capture_safe
+        QTimer.singleShot(0, self.repeat_region)
+
+    def on_commit_data(self, manager):
+        # Logging out: save now. Qt then closes every window before control
+        # returns to the event loop; those closes aren't the user closing pins.
+        # If the logout is cancelled we keep running and record changes again.
+        self.session.save_now()
+        self.session.pause()
+        QTimer.singleShot(0, self.session.resume)
+
+    def quit(self):
+        # Qt closes all windows on quit; persist the session before it does
+        self.session.shutdown()
+        self.app.quit()
+
+    def warm_up(self):
+        """
+        Runs once the event loop is up: everything the first capture needs
+        is loaded now rather than on the first hotkey press, one step per
+        event-loop turn so the tray stays responsive in between.
+        """
+        profiler.mark("event loop started")
+
+        def preload():
+            start = time.perf_counter()
+            for name in PRELOAD_MODULES:
+                importlib.import_module(name)
+            self.preloaded.emit(start)
+
+        threading.Thread(target=preload, name="bora-preload", daemon=True).start()
+
+        def rank_backends():
+            import capture_backends
+            capture_backends.ranked_backends()
+            profiler.done("rank capture backends")
+
+        def snipper():
+            self.prepare_snipper()
+            profiler.done("pre-create capture overlays")
+
+        QTimer.singleShot(0, rank_backends)
+        QTimer.singleShot(0, snipper)
+
+    def restore_session_deferred(self):
+        start = time.perf_counter()
+        self.restore_session()
+        profiler.done("restore session", start)
+
     def run(self):
         self.setup_hotkeys()
+        profiler.mark("hotkey listeners")
+        self.ipc_server.start()
+        profiler.mark("IPC server")
+        profiler.expect("rank capture backends", "pre-create capture overlays", "preload NumPy/diff/export (background)")
+        # Pins come back once the event loop runs, after the tray and hotkeys
+        if ConfigManager.get('restore_session', True):
+            profiler.expect("restore session")
+            QTimer.singleShot(0, self.restore_session_deferred)
+        QTimer.singleShot(0, self.warm_up)
         sys.exit(self.app.exec())
 
 def exception_hook(exctype, value, traceback):
@@ -210,7 +609,47 @@ def exception_hook(exctype, value, traceback):
     tb.print_tb(traceback)
     sys.__excepthook__(exctype, value, traceback)
 
+def run_cli_command(args):
+    # Talk to the already running instance instead of starting a new one
+    from batch_export import FORMATS
+    if args.export and args.format not in FORMATS:
+        print(f"Unsupported format: {args.format} (choose from {', '.join(FORMATS)})")
+        return 2
+    try:
+        if args.export:
+            reply = ipc.send_command('export', {'directory': os.path.abspath(args.export), 'format': args.format},
+                                     timeout=EXPORT_TIMEOUT)
+        elif args.repeat_region is not None:
+            reply = ipc.send_command('repeat-region', {'index': args.repeat_region, 'mode': 'copy' if args.copy else 'pin'})
+        else:
+            reply = ipc.send_command('memory')
+    except TimeoutError:
+        print("Timed out waiting for the running Bora instance to reply")
+        return 1
+    except OSError as e:
+        print(f"Could not reach a running Bora instance: {e}")
+        return 1
+    print(json.dumps(reply, indent=4))
+    return 0 if reply.get('ok') else 1
+
 if __name__ == "__main__":
+    # Required for the export process pool in PyInstaller builds
+    multiprocessing.freeze_support()
+    
+    parser = argparse.ArgumentParser(description="Bora screen capture")
+    parser.add_argument('--export', metavar='DIR', help="export all pins of the running instance to DIR")
+    # Choices are checked in run_cli_command so a normal launch doesn't import batch_export
+    parser.add_argument('--format', default='png', help="image format for --export (png, jpg, webp)")
+    parser.add_argument('--memory', action='store_true', help="print pixel memory usage of the running instance")
+    parser.add_argument('--repeat-region', type=int, nargs='?', const=0, metavar='N',
+                        help="re-capture the Nth most recent region (default 0, the last one) without the overlay")
+    parser.add_argument('--copy', action='store_true', help="with --repeat-region, copy to the clipboard instead of pinning")
+    parser.add_argument('--profile-startup', action='store_true', help="print a per-phase startup timing report")
+    args, _ = parser.parse_known_args()
+    if args.export or args.memory or args.repeat_region is not None:
+        sys.exit(run_cli_command(args))
+    
     sys.excepthook = exception_hook
+    profiler.enabled = args.profile_startup
     app = BoraUbuntu()
     app.run()
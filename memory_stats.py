@@ -0,0 +1,43 @@
+def pixmap_bytes(pixmap):
+    """Bytes held by a pixmap's pixel buffer (0 for null or released pixmaps)."""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def format_bytes(n):
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+class MemoryTracker:
+    """
+    Accounts for the pixel memory Bora holds: every pin's image plus the
+    per-screen capture frames while the selection overlays are open. The
+    peak is tracked from samples taken whenever a capture starts or a pin
+    is added.
+    """
+
+    def __init__(self):
+        self.peak = 0
+
+    def sample(self, pins, capture_pixmaps=()):
+        per_pin = []
+        for pin in pins:
+            size = pin.original_pixmap.size()
+            per_pin.append({
+                'id': pin.pin_id,
+                'width': size.width(),
+                'height': size.height(),
+                'bytes': pixmap_bytes(pin.original_pixmap),
+            })
+        pin_bytes = sum(p['bytes'] for p in per_pin)
+        capture_bytes = sum(pixmap_bytes(p) for p in capture_pixmaps)
+        total = pin_bytes + capture_bytes
+        self.peak = max(self.peak, total)
+        return {
+            'pins': per_pin,
+            'pin_bytes': pin_bytes,
+            'capture_bytes': capture_bytes,
+            'total_bytes': total,
+            'peak_bytes': self.peak,
+        }
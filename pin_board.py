@@ -0,0 +1,420 @@
+import uuid
+
+from PyQt6.QtWidgets import QWidget, QMenu, QApplication, QFileDialog
+from PyQt6.QtCore import Qt, QObject, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QRegion, QAction, QGuiApplication, QFont
+
+# Space kept around each pin for the shadow and the resize handles,
+# matching the margins FloatingWidget reserves around its image.
+PIN_MARGIN = 20
+RESIZE_MARGIN = 10
+
+
+def get_resize_edge(pin_rect, pos, margin=RESIZE_MARGIN):
+    """Same edge detection as FloatingWidget, but against a pin's frame rect."""
+    frame = pin_rect.adjusted(-PIN_MARGIN, -PIN_MARGIN, PIN_MARGIN, PIN_MARGIN)
+    if not frame.contains(pos):
+        return None, None
+
+    left = pos.x() <= frame.left() + margin
+    right = pos.x() >= frame.right() - margin
+    top = pos.y() <= frame.top() + margin
+    bottom = pos.y() >= frame.bottom() - margin
+
+    if top and left: return Qt.CursorShape.SizeFDiagCursor, 'tl'
+    if top and right: return Qt.CursorShape.SizeBDiagCursor, 'tr'
+    if bottom and left: return Qt.CursorShape.SizeBDiagCursor, 'bl'
+    if bottom and right: return Qt.CursorShape.SizeFDiagCursor, 'br'
+    if left: return Qt.CursorShape.SizeHorCursor, 'l'
+    if right: return Qt.CursorShape.SizeHorCursor, 'r'
+    if top: return Qt.CursorShape.SizeVerCursor, 't'
+    if bottom: return Qt.CursorShape.SizeVerCursor, 'b'
+
+    return None, None
+
+
+def resize_rect(rect, edge, delta, min_size):
+    """
+    Move the given edges of rect by delta, never going below min_size.
+    Left/top drags keep the opposite edge fixed, so once the minimum is hit
+    the rect stops shrinking instead of sliding.
+    """
+    geo = QRect(rect)
+    min_w = min_size.width()
+    min_h = min_size.height()
+
+    if 'r' in edge:
+        geo.setWidth(max(min_w, geo.width() + delta.x()))
+    if 'b' in edge:
+        geo.setHeight(max(min_h, geo.height() + delta.y()))
+    if 'l' in edge:
+        new_w = max(min_w, geo.width() - delta.x())
+        geo.setLeft(geo.right() - new_w + 1)
+    if 't' in edge:
+        new_h = max(min_h, geo.height() - delta.y())
+        geo.setTop(geo.bottom() - new_h + 1)
+    return geo
+
+
+class BoardPin:
+    """A pinned capture drawn onto a shared PinBoard instead of its own window."""
+
+    def __init__(self, pixmap, geometry, pin_id=None, source_rect=None, min_size=None):
+        self.original_pixmap = pixmap
+        self.pin_id = pin_id or uuid.uuid4().hex
+        # Where the capture came from, kept so it survives a restart
+        self.source_rect = QRect(source_rect) if source_rect else None
+        # Image rect in global coordinates (without shadow margins)
+        self.rect = QRect(geometry)
+        # Original capture size; a restored geometry may have been enlarged
+        self.min_size = QSize(min_size) if min_size else geometry.size()
+        self.opacity = 1.0
+        # Set when showing a restored thumbnail until the full image is decoded
+        self.pending_image_path = None
+
+    def frame_rect(self):
+        return self.rect.adjusted(-PIN_MARGIN, -PIN_MARGIN, PIN_MARGIN, PIN_MARGIN)
+
+    def image_geometry(self):
+        return QRect(self.rect)
+
+    def current_opacity(self):
+        return self.opacity
+
+    def set_full_pixmap(self, pixmap):
+        self.original_pixmap = pixmap
+        self.pending_image_path = None
+
+    def ensure_full_pixmap(self):
+        if self.pending_image_path:
+            self.set_full_pixmap(QPixmap(self.pending_image_path))
+
+
+class PinBoard(QWidget):
+    """
+    One transparent, always-on-top overlay per screen that paints every pin
+    on that screen. The window mask is kept to the union of the pin frames so
+    clicks elsewhere still reach the windows underneath.
+    """
+
+    def __init__(self, manager, screen):
+        super().__init__()
+        self.manager = manager
+        self.screen_ref = screen
+        self.pins = []  # Bottom to top
+
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+        # Interaction state
+        self.active_pin = None
+        self.drag_position = None
+        self.resizing = False
+        self.resize_edge = None
+        self.toast = None
+
+        self.setGeometry(screen.geometry())
+
+    # --- Pin bookkeeping -------------------------------------------------
+
+    def add_pin(self, pin):
+        self.pins.append(pin)
+        self.active_pin = pin
+        self.update_mask()
+        self.update_pin_area(pin.frame_rect())
+        if not self.isVisible():
+            self.show()
+        self.raise_()
+
+    def remove_pin(self, pin):
+        if pin not in self.pins:
+            return
+        area = pin.frame_rect()
+        self.pins.remove(pin)
+        if self.active_pin is pin:
+            self.active_pin = self.pins[-1] if self.pins else None
+        if self.toast and self.toast[0] is pin:
+            self.toast = None
+        self.update_mask()
+        self.update_pin_area(area)
+        if not self.pins:
+            self.hide()
+
+    def raise_pin(self, pin):
+        if self.pins and self.pins[-1] is not pin:
+            self.pins.remove(pin)
+            self.pins.append(pin)
+            self.update_pin_area(pin.frame_rect())
+
+    def pin_at(self, global_pos):
+        for pin in reversed(self.pins):
+            if pin.frame_rect().contains(global_pos):
+                return pin
+        return None
+
+    def to_local(self, rect):
+        return rect.translated(-self.geometry().topLeft())
+
+    def update_pin_area(self, global_rect):
+        self.update(self.to_local(global_rect))
+
+    def update_mask(self):
+        region = QRegion()
+        for pin in self.pins:
+            region = region.united(QRegion(self.to_local(pin.frame_rect())))
+        self.setMask(region)
+
+    # --- Painting --------------------------------------------------------
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        dirty = event.rect()
+
+        for pin in self.pins:
+            local = self.to_local(pin.rect)
+            if not local.adjusted(-PIN_MARGIN, -PIN_MARGIN, PIN_MARGIN, PIN_MARGIN).intersects(dirty):
+                continue
+
+            painter.setOpacity(pin.opacity)
+            # Cheap layered shadow instead of a per-pin QGraphicsDropShadowEffect
+            painter.setPen(Qt.PenStyle.NoPen)
+            for spread, alpha in ((12, 20), (8, 35), (4, 60)):
+                painter.setBrush(QColor(0, 0, 0, alpha))
+                painter.drawRoundedRect(local.adjusted(-spread, -spread + 5, spread, spread + 5), spread, spread)
+            painter.drawPixmap(local, pin.original_pixmap)
+
+        painter.setOpacity(1.0)
+        if self.toast:
+            self.paint_toast(painter, *self.toast)
+
+    def paint_toast(self, painter, pin, message):
+        font = QFont(painter.font())
+        font.setBold(True)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        text_rect = painter.fontMetrics().boundingRect(message).adjusted(-16, -8, 16, 8)
+        text_rect.moveCenter(self.to_local(pin.rect).center())
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 180))
+        painter.drawRoundedRect(text_rect, 15, 15)
+        painter.setPen(QColor("white"))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, message)
+
+    def show_toast(self, pin, message):
+        self.toast = (pin, message)
+        self.update_pin_area(pin.frame_rect())
+
+        def clear():
+            if self.toast and self.toast[0] is pin:
+                self.toast = None
+                self.update_pin_area(pin.frame_rect())
+        QTimer.singleShot(1500, clear)
+
+    # --- Interaction -----------------------------------------------------
+
+    def mousePressEvent(self, event):
+        global_pos = event.globalPosition().toPoint()
+        pin = self.pin_at(global_pos)
+        if not pin:
+            event.ignore()
+            return
+
+        self.active_pin = pin
+        self.raise_pin(pin)
+
+        if event.button() == Qt.MouseButton.LeftButton:
+            cursor, edge = get_resize_edge(pin.rect, global_pos)
+            if edge:
+                self.resizing = True
+                self.resize_edge = edge
+                self.drag_position = global_pos
+            else:
+                self.drag_position = global_pos - pin.rect.topLeft()
+            event.accept()
+        elif event.button() == Qt.MouseButton.RightButton:
+            self.show_context_menu(pin, global_pos)
+
+    def mouseMoveEvent(self, event):
+        global_pos = event.globalPosition().toPoint()
+        pin = self.active_pin
+
+        if not self.resizing and not (event.buttons() & Qt.MouseButton.LeftButton):
+            hovered = self.pin_at(global_pos)
+            cursor = get_resize_edge(hovered.rect, global_pos)[0] if hovered else None
+            self.setCursor(cursor if cursor else Qt.CursorShape.ArrowCursor)
+            return
+
+        if pin and event.buttons() & Qt.MouseButton.LeftButton:
+            old_area = pin.frame_rect()
+            if self.resizing:
+                self.handle_resize(pin, global_pos)
+            elif self.drag_position is not None:
+                pin.rect.moveTopLeft(global_pos - self.drag_position)
+            self.update_mask()
+            self.update_pin_area(old_area.united(pin.frame_rect()))
+            event.accept()
+
+    def handle_resize(self, pin, global_pos):
+        diff = global_pos - self.drag_position
+        self.drag_position = global_pos
+        pin.rect = resize_rect(pin.rect, self.resize_edge, diff, pin.min_size)
+
+    def mouseReleaseEvent(self, event):
+        pin = self.active_pin
+        was_dragging = self.drag_position is not None
+        self.drag_position = None
+        self.resizing = False
+        self.resize_edge = None
+        if pin and was_dragging:
+            # Hand the pin over if it was dropped onto another screen
+            self.manager.rehome(pin, self)
+            self.manager.pin_changed.emit(pin)
+
+    def wheelEvent(self, event):
+        pin = self.pin_at(event.globalPosition().toPoint())
+        if not pin:
+            event.ignore()
+            return
+        if event.angleDelta().y() > 0:
+            pin.opacity = min(1.0, pin.opacity + 0.1)
+        else:
+            pin.opacity = max(0.2, pin.opacity - 0.1)
+        self.update_pin_area(pin.frame_rect())
+        self.manager.pin_changed.emit(pin)
+
+    def keyPressEvent(self, event):
+        pin = self.active_pin
+        if not pin:
+            return super().keyPressEvent(event)
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            if event.key() in (Qt.Key.Key_W, Qt.Key.Key_Q):
+                self.manager.close_pin(pin)
+                return
+            if event.key() == Qt.Key.Key_C:
+                self.copy_to_clipboard(pin)
+                return
+        super().keyPressEvent(event)
+
+    def show_context_menu(self, pin, pos):
+        menu = QMenu(self)
+
+        save_action = QAction("Save", self)
+        save_action.triggered.connect(lambda: self.save_image(pin))
+        menu.addAction(save_action)
+
+        copy_action = QAction("Copy to Clipboard", self)
+        copy_action.triggered.connect(lambda: self.copy_to_clipboard(pin))
+        menu.addAction(copy_action)
+
+        menu.addSeparator()
+
+        if pin.source_rect:
+            live_action = QAction("Compare with Live Screen", self)
+            live_action.triggered.connect(lambda: self.manager.compare_requested.emit(pin, None))
+            menu.addAction(live_action)
+
+        compare_peers = self.manager.compare_peers
+        peers = [p for p in (compare_peers() if compare_peers else []) if p is not pin]
+        if peers:
+            compare_menu = menu.addMenu("Compare with Pin")
+            for i, peer in enumerate(peers, 1):
+                size = peer.original_pixmap.size()
+                action = QAction(f"Pin {i} ({size.width()}x{size.height()})", compare_menu)
+                action.triggered.connect(lambda checked=False, p=peer: self.manager.compare_requested.emit(pin, p))
+                compare_menu.addAction(action)
+
+        menu.addSeparator()
+
+        close_action = QAction("Close", self)
+        close_action.triggered.connect(lambda: self.manager.close_pin(pin))
+        menu.addAction(close_action)
+
+        menu.exec(pos)
+
+    def save_image(self, pin):
+        pin.ensure_full_pixmap()
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Image", "", "PNG Files (*.png);;All Files (*)")
+        if file_path:
+            pin.original_pixmap.save(file_path, "PNG")
+
+    def copy_to_clipboard(self, pin):
+        pin.ensure_full_pixmap()
+        clipboard = QGuiApplication.clipboard()
+        clipboard.setPixmap(pin.original_pixmap)
+        self.show_toast(pin, "Copied!")
+
+
+class PinBoardManager(QObject):
+    """Owns one PinBoard per screen and routes pins to the right one."""
+    pin_changed = pyqtSignal(object)
+    pin_closed = pyqtSignal(object)
+    # (pin, other pin or None for the live screen), as in FloatingWidget
+    compare_requested = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.boards = {}
+        # Callable returning every pin (board or window) a pin can be compared with
+        self.compare_peers = None
+
+        app = QApplication.instance()
+        app.screenAdded.connect(self.on_screen_added)
+        app.screenRemoved.connect(self.on_screen_removed)
+        for screen in QApplication.screens():
+            self.on_screen_added(screen)
+
+    def on_screen_added(self, screen):
+        board = PinBoard(self, screen)
+        screen.geometryChanged.connect(lambda geo, b=board: self.on_screen_geometry_changed(b, geo))
+        self.boards[screen] = board
+
+    def on_screen_removed(self, screen):
+        board = self.boards.pop(screen, None)
+        if not board:
+            return
+        orphans = list(board.pins)
+        board.pins = []
+        board.deleteLater()
+        for pin in orphans:
+            self.board_for(pin.rect).add_pin(pin)
+
+    def on_screen_geometry_changed(self, board, geometry):
+        board.setGeometry(geometry)
+        board.update_mask()
+        board.update()
+
+    def board_for(self, rect):
+        screen = QGuiApplication.screenAt(rect.center()) or QApplication.primaryScreen()
+        return self.boards[screen]
+
+    def add_pin(self, pixmap, rect, pin_id=None, source_rect=None, min_size=None):
+        pin = BoardPin(pixmap, rect, pin_id, source_rect, min_size)
+        self.board_for(pin.rect).add_pin(pin)
+        return pin
+
+    def refresh_pin(self, pin):
+        for board in self.boards.values():
+            if pin in board.pins:
+                board.update_pin_area(pin.frame_rect())
+
+    def rehome(self, pin, board):
+        target = self.board_for(pin.rect)
+        if target is not board:
+            board.remove_pin(pin)
+            target.add_pin(pin)
+
+    def close_pin(self, pin):
+        for board in self.boards.values():
+            board.remove_pin(pin)
+        self.pin_closed.emit(pin)
+        pin.original_pixmap = QPixmap()
+
+    def pins(self):
+        return [pin for board in self.boards.values() for pin in board.pins]
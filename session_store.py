@@ -0,0 +1,219 @@
+import json
+import os
+import queue
+import threading
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage
+
+SESSION_DIR = os.path.join(
+    os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share')),
+    'bora', 'session'
+)
+MANIFEST_FILE = 'session.json'
+THUMB_MAX = 256
+SAVE_DELAY_MS = 500
+# Restored pins not yet interacted with are decoded one per interval, so a
+# large session doesn't land on the GUI thread all at once after launch
+DECODE_INTERVAL_MS = 250
+
+
+class _Worker:
+    """Single background thread running queued jobs in order."""
+
+    def __init__(self, name):
+        self.jobs = queue.Queue()
+        self.thread = threading.Thread(target=self.loop, name=name, daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, *args):
+        self.jobs.put((fn, args))
+
+    def loop(self):
+        while True:
+            fn, args = self.jobs.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Session worker error: {e}")
+            finally:
+                self.jobs.task_done()
+
+    def join(self):
+        self.jobs.join()
+
+
+class SessionStore(QObject):
+    """
+    Persists pins incrementally so they survive a restart.
+
+    Each pin's image and thumbnail are written once, when the pin is tracked;
+    geometry and opacity live in a small manifest that is rewritten (debounced)
+    whenever a pin changes. All disk I/O and image decoding run on worker
+    threads; results come back through the image_loaded signal.
+    """
+    image_loaded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent=None, session_dir=SESSION_DIR):
+        super().__init__(parent)
+        self.session_dir = session_dir
+        self.pins = {}  # pin_id -> pin, in creation order
+        # False while windows are being torn down (quit, logout), so those
+        # closes aren't recorded as the user closing pins
+        self.accepting = True
+        self.last_entries = {}  # pin_id -> last manifest entry written
+
+        self.writer = _Worker("bora-session-writer")
+        self.decoder = _Worker("bora-session-decoder")
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save_manifest)
+
+        self.decode_queue = []  # pin ids waiting for a background decode
+        self.decode_requested = set()
+        self.decode_timer = QTimer(self)
+        self.decode_timer.setInterval(DECODE_INTERVAL_MS)
+        self.decode_timer.timeout.connect(self.decode_next)
+
+    def image_path(self, pin_id):
+        return os.path.join(self.session_dir, f"{pin_id}.png")
+
+    def thumbnail_path(self, pin_id):
+        return os.path.join(self.session_dir, f"{pin_id}.thumb.png")
+
+    # --- Tracking --------------------------------------------------------
+
+    def track(self, pin, saved=False):
+        if not self.accepting:
+            return
+        self.pins[pin.pin_id] = pin
+        if not saved:
+            # QPixmap is GUI-thread only; hand the worker a QImage copy
+            image = pin.original_pixmap.toImage()
+            self.writer.submit(self._write_images, pin.pin_id, image)
+        self.mark_dirty()
+
+    def untrack(self, pin):
+        if not self.accepting or self.pins.pop(pin.pin_id, None) is None:
+            return
+        self.writer.submit(self._remove_images, pin.pin_id)
+        self.mark_dirty()
+
+    def mark_dirty(self, pin=None):
+        if self.accepting:
+            self.save_timer.start()
+
+    def snapshot(self):
+        entries = []
+        for pin_id, pin in self.pins.items():
+            try:
+                geo = pin.image_geometry()
+                opacity = pin.current_opacity()
+            except RuntimeError:
+                # Widget deleted by a teardown close we ignored; keep its last state
+                if pin_id in self.last_entries:
+                    entries.append(self.last_entries[pin_id])
+                continue
+            source = pin.source_rect
+            min_size = pin.min_size
+            entry = self.last_entries[pin_id] = {
+                'id': pin_id,
+                'geometry': [geo.x(), geo.y(), geo.width(), geo.height()],
+                'source': [source.x(), source.y(), source.width(), source.height()] if source else None,
+                'min_size': [min_size.width(), min_size.height()],
+                'opacity': round(opacity, 2),
+                'watch': getattr(pin, 'watching', False),
+            }
+            entries.append(entry)
+        return {'version': 1, 'pins': entries}
+
+    def save_manifest(self):
+        self.writer.submit(self._write_manifest, self.snapshot())
+
+    def save_now(self):
+        """Write the manifest and wait for all pending I/O."""
+        if not self.accepting:
+            return
+        self.save_timer.stop()
+        self.save_manifest()
+        self.writer.join()
+
+    def pause(self):
+        """Ignore pin changes and closes until resume(); for window teardown."""
+        self.accepting = False
+
+    def resume(self):
+        self.accepting = True
+
+    def shutdown(self):
+        """Write the final state and stop recording. Call on quit."""
+        self.save_now()
+        # Pins are torn down after this point; don't treat that as closing them
+        self.pause()
+
+    # --- Restoring -------------------------------------------------------
+
+    def load_entries(self):
+        path = os.path.join(self.session_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return []
+        try:
+            with open(path, 'r') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"Failed to read session manifest: {e}")
+            return []
+        return [e for e in manifest.get('pins', []) if os.path.exists(self.image_path(e['id']))]
+
+    def request_full_image(self, pin_id):
+        """Decode a pin's full image now, e.g. because the user is interacting with it."""
+        if pin_id in self.decode_requested or pin_id not in self.pins:
+            return
+        self.decode_requested.add(pin_id)
+        self.decoder.submit(self._decode_image, pin_id)
+
+    def queue_full_image(self, pin_id):
+        """Decode a pin's full image eventually, rate-limited by DECODE_INTERVAL_MS."""
+        self.decode_queue.append(pin_id)
+        self.decode_timer.start()
+
+    def decode_next(self):
+        while self.decode_queue:
+            pin_id = self.decode_queue.pop(0)
+            if pin_id in self.pins and pin_id not in self.decode_requested:
+                self.request_full_image(pin_id)
+                return
+        self.decode_timer.stop()
+
+    # --- Worker jobs -----------------------------------------------------
+
+    def _write_images(self, pin_id, image):
+        os.makedirs(self.session_dir, exist_ok=True)
+        image.save(self.image_path(pin_id), "PNG")
+        thumb = image
+        if max(image.width(), image.height()) > THUMB_MAX:
+            thumb = image.scaled(THUMB_MAX, THUMB_MAX,
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.FastTransformation)
+        thumb.save(self.thumbnail_path(pin_id), "PNG")
+
+    def _remove_images(self, pin_id):
+        for path in (self.image_path(pin_id), self.thumbnail_path(pin_id)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write_manifest(self, manifest):
+        os.makedirs(self.session_dir, exist_ok=True)
+        path = os.path.join(self.session_dir, MANIFEST_FILE)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(tmp_path, path)
+
+    def _decode_image(self, pin_id):
+        image = QImage(self.image_path(pin_id))
+        if not image.isNull():
+            # Queued across threads to the receiver in the GUI thread
+            self.image_loaded.emit(pin_id, image)
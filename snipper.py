@@ -1,172 +1,260 @@
-import sys
 from PyQt6.QtWidgets import QWidget, QApplication, QMessageBox
-from PyQt6.QtCore import Qt, QRect, pyqtSignal, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QScreen
+from PyQt6.QtCore import Qt, QObject, QRect, pyqtSignal, QPoint
+from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QCursor
 
-class Snipper(QWidget):
-    capture_signal = pyqtSignal(QPixmap, QRect)
+DIM_COLOR = QColor(0, 0, 0, 100)  # Semi-transparent black
+BORDER_COLOR = QColor(0, 120, 215)
+BORDER_WIDTH = 2
+
+
+class ScreenOverlay(QWidget):
+    """
+    Selection overlay covering exactly one screen. It owns only that
+    screen's slice of the capture and forwards mouse input, in global
+    coordinates, to the Snipper coordinating all overlays.
+    """
+
+    def __init__(self, snipper, screen):
+        super().__init__()
+        self.snipper = snipper
+        self.screen_ref = screen
+        self.pixmap = None
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
         self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint | 
-            Qt.WindowType.WindowStaysOnTopHint | 
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnTopHint |
             Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+
+        # Create the native window now so the first show() only has to map it
+        self.winId()
+        self.follow_screen(screen.geometry())
+
+    def follow_screen(self, geometry):
+        # Fullscreen on its own screen so the WM stacks it above panels and docks
+        self.setScreen(self.screen_ref)
+        self.setGeometry(geometry)
         self.setWindowState(Qt.WindowState.WindowFullScreen)
-        
-        # State
-        self.is_snipping = False
-        self.start_point = QPoint()
-        self.end_point = QPoint()
-        
-        # Capture full screen immediately
-        screen = QApplication.primaryScreen()
-        # Handle multi-screen geometry union if needed, but for simplicity starts with virtual geometry
-        # Combining all screens:
-        self.full_screen_pixmap = self.grab_all_screens()
-        
-        # Geometry setup
-        self.setGeometry(self.get_virtual_geometry())
-        self.show()
-
-    def get_virtual_geometry(self):
-        geometry = QRect()
-        for screen in QApplication.screens():
-            geometry = geometry.united(screen.geometry())
-        return geometry
-
-    def grab_all_screens(self):
-        import mss
-        import numpy as np
-        from PyQt6.QtGui import QImage
-        import os
-        import subprocess
-        import tempfile
-
-        # Check for Wayland
-        session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
-        is_wayland = 'wayland' in session_type
-
-        # Wayland specific capture using gnome-screenshot (common on Ubuntu)
-        if is_wayland:
-            print("Wayland session detected. Attempting to use gnome-screenshot...")
-            try:
-                # Create a temporary file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tf:
-                    temp_filename = tf.name
-                
-                # Check if gnome-screenshot exists, otherwise fall back or warn
-                # Ubuntu 22.04+ might need: sudo apt install gnome-screenshot
-                subprocess.run(['gnome-screenshot', '-f', temp_filename], check=True)
-                
-                # Load into QPixmap
-                pixmap = QPixmap(temp_filename)
-                
-                # Cleanup
-                os.remove(temp_filename)
-                
-                if not pixmap.isNull():
-                    # Update geometry to match the pixmap
-                    self.resize(pixmap.width(), pixmap.height())
-                    self.move(0, 0)
-                    return pixmap
-            except subprocess.CalledProcessError:
-                print("gnome-screenshot failed.")
-            except FileNotFoundError:
-                print("gnome-screenshot not found.")
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(None, "Capture Failed", 
-                                    "Wayland session detected but 'gnome-screenshot' is missing.\n"
-                                    "Please install it: sudo apt install gnome-screenshot")
-                # Fall through to try MSS or return black
-            except Exception as e:
-                print(f"Wayland capture failed: {e}")
-
-        # Default / Fallback to MSS (X11 / macOS / Windows)
-        try:
-            with mss.mss() as sct:
-                # Capture all monitors (virtual monitor 0)
-                monitor = sct.monitors[0] 
-                sct_img = sct.grab(monitor)
-                
-                img_data = sct_img.bgra
-                
-                qimage = QImage(img_data, sct_img.width, sct_img.height, QImage.Format.Format_ARGB32)
-                pixmap = QPixmap.fromImage(qimage)
-                
-                self.move(monitor['left'], monitor['top'])
-                self.resize(monitor['width'], monitor['height'])
-                
-                return pixmap
-        except Exception as e:
-            print(f"Error capturing screen: {e}")
-            # On macOS, this often happens if Screen Recording permission is denied.
-            # Return a blank pixmap to prevent crash
-            blank = QPixmap(self.size())
-            blank.fill(QColor("black"))
-            return blank
+
+    def scale(self):
+        # Grabs are in device pixels; the widget is in logical ones
+        if not self.pixmap or self.width() == 0:
+            return 1.0
+        return self.pixmap.width() / self.width()
+
+    def source_rect(self, local_rect):
+        s = self.scale()
+        return QRect(round(local_rect.x() * s), round(local_rect.y() * s),
+                     round(local_rect.width() * s), round(local_rect.height() * s))
+
+    def update_global(self, global_rect):
+        """Repaint the part of a global rect that falls on this screen."""
+        part = global_rect.intersected(self.geometry())
+        if not part.isEmpty():
+            self.update(part.translated(-self.geometry().topLeft()))
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        
-        if self.full_screen_pixmap:
-             # Draw the full dimmed screenshot
-            painter.drawPixmap(0, 0, self.full_screen_pixmap)
+        dirty = event.rect()
+
+        if self.pixmap:
+            # Draw the dimmed screenshot, only where it needs repainting
+            painter.drawPixmap(dirty, self.pixmap, self.source_rect(dirty))
         else:
-            painter.fillRect(self.rect(), Qt.GlobalColor.black)
-        
-        # Dimming overlay
-        dim_color = QColor(0, 0, 0, 100) # Semi-transparent black
-        painter.fillRect(self.rect(), dim_color)
-        
-        if self.is_snipping:
-            # Calculate rect
-            selection_rect = QRect(self.start_point, self.end_point).normalized()
-            
-            # Draw the clear (undimmed) area by redrawing that part of the pixmap
-            if self.full_screen_pixmap:
-                painter.drawPixmap(selection_rect, self.full_screen_pixmap, selection_rect)
-            
-            # Draw border
-            painter.setPen(QPen(QColor(0, 120, 215), 2))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(selection_rect)
+            painter.fillRect(dirty, Qt.GlobalColor.black)
+        painter.fillRect(dirty, DIM_COLOR)
+
+        selection = self.snipper.selection_rect()
+        if selection is None:
+            return
+        local = selection.translated(-self.geometry().topLeft())
+        visible = local.intersected(self.rect())
+        if visible.isEmpty():
+            return
+
+        # Draw the clear (undimmed) area by redrawing that part of the pixmap
+        if self.pixmap:
+            painter.drawPixmap(visible, self.pixmap, self.source_rect(visible))
+
+        # Draw border
+        painter.setPen(QPen(BORDER_COLOR, BORDER_WIDTH))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(local)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.is_snipping = True
-            self.start_point = event.pos()
-            self.end_point = event.pos()
-            self.update()
+            self.snipper.begin_selection(event.globalPosition().toPoint())
 
     def mouseMoveEvent(self, event):
-        if self.is_snipping:
-            self.end_point = event.pos()
-            self.update()
+        # The pressed overlay keeps the mouse grab even past its screen edge
+        self.snipper.extend_selection(event.globalPosition().toPoint())
 
     def mouseReleaseEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.is_snipping:
-            self.is_snipping = False
-            selection_rect = QRect(self.start_point, self.end_point).normalized()
-            
-            # Minimum size check
-            if selection_rect.width() > 10 and selection_rect.height() > 10:
-                if self.full_screen_pixmap:
-                    cropped = self.full_screen_pixmap.copy(selection_rect)
-                    # selection_rect is in local coords, which match global coords if full screen
-                    # But let's map to global just in case we change window logic later
-                    global_pos = self.mapToGlobal(selection_rect.topLeft())
-                    global_rect = QRect(global_pos, selection_rect.size())
-                    self.capture_signal.emit(cropped, global_rect)
-                self.close()
-            else:
-                self.start_point = QPoint()
-                self.end_point = QPoint()
-                self.update()
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.snipper.end_selection()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
-            self.is_snipping = False
-            self.close()
+            self.snipper.finish()
+
+    def closeEvent(self, event):
+        # Closing (e.g. on quit) still releases the frame
+        self.pixmap = None
+        super().closeEvent(event)
+
+
+class Snipper(QObject):
+    """
+    Coordinates one ScreenOverlay per QScreen. Overlays are created once and
+    kept hidden between captures; start() grabs each screen's slice and shows
+    them, finish() hides them again and releases the slices. A selection may
+    span screens and is assembled from the slices it covers.
+    """
+    capture_signal = pyqtSignal(QPixmap, QRect)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.overlays = {}
+
+        # State
+        self.is_snipping = False
+        self.start_point = QPoint()
+        self.end_point = QPoint()
+
+        app = QApplication.instance()
+        app.screenAdded.connect(self.add_overlay)
+        app.screenRemoved.connect(self.remove_overlay)
+        for screen in QApplication.screens():
+            self.add_overlay(screen)
+
+    def add_overlay(self, screen):
+        overlay = ScreenOverlay(self, screen)
+        screen.geometryChanged.connect(overlay.follow_screen)
+        self.overlays[screen] = overlay
+
+    def remove_overlay(self, screen):
+        overlay = self.overlays.pop(screen, None)
+        if overlay:
+            overlay.pixmap = None
+            overlay.deleteLater()
+
+    def is_active(self):
+        return any(o.isVisible() for o in self.overlays.values())
+
+    def pixmaps(self):
+        return [o.pixmap for o in self.overlays.values() if o.pixmap]
+
+    def grab_screens(self):
+        import capture_backends
+
+        overlays = list(self.overlays.values())
+        try:
+            images = capture_backends.grab_many([o.geometry() for o in overlays])
+        except capture_backends.CaptureError as e:
+            print(f"Error capturing screen: {e}")
+            message = f"Could not capture the screen.\n\n{e}"
+            if capture_backends.session_type() == 'wayland':
+                message += "\n\nOn Wayland, install gnome-screenshot: sudo apt install gnome-screenshot"
+            QMessageBox.warning(None, "Capture Failed", message)
+            return False
+
+        for overlay, image in zip(overlays, images):
+            overlay.pixmap = QPixmap.fromImage(image)
+        return True
+
+    def start(self):
+        """Grab every screen and show the overlays. Returns False if the grab failed."""
+        if not self.grab_screens():
+            return False
+
+        self.is_snipping = False
+        self.start_point = QPoint()
+        self.end_point = QPoint()
+        for overlay in self.overlays.values():
+            overlay.showFullScreen()
+            overlay.raise_()
+
+        # Keyboard focus (for Esc) goes to the screen under the cursor
+        focus = QApplication.screenAt(QCursor.pos())
+        if focus in self.overlays:
+            self.overlays[focus].activateWindow()
+        return True
+
+    def finish(self):
+        # Hide rather than close so the windows are reused; the frames go now
+        self.is_snipping = False
+        for overlay in self.overlays.values():
+            overlay.hide()
+            overlay.pixmap = None
+
+    def selection_rect(self):
+        if not self.is_snipping and self.start_point == self.end_point:
+            return None
+        return QRect(self.start_point, self.end_point).normalized()
+
+    def update_area(self, global_rect):
+        # Pad for the border, which is drawn centred on the rect edge
+        area = global_rect.adjusted(-BORDER_WIDTH, -BORDER_WIDTH, BORDER_WIDTH, BORDER_WIDTH)
+        for overlay in self.overlays.values():
+            overlay.update_global(area)
+
+    def begin_selection(self, global_pos):
+        old = self.selection_rect()
+        self.is_snipping = True
+        self.start_point = global_pos
+        self.end_point = global_pos
+        if old:
+            self.update_area(old)
+
+    def extend_selection(self, global_pos):
+        if not self.is_snipping:
+            return
+        old = self.selection_rect()
+        self.end_point = global_pos
+        self.update_area(old.united(self.selection_rect()))
+
+    def end_selection(self):
+        if not self.is_snipping:
+            return
+        self.is_snipping = False
+        selection_rect = QRect(self.start_point, self.end_point).normalized()
+        # Dragging past the outer edge of the desktop doesn't extend the capture
+        bounds = QRect()
+        for overlay in self.overlays.values():
+            bounds = bounds.united(overlay.geometry())
+        selection_rect = selection_rect.intersected(bounds)
+
+        # Minimum size check
+        if selection_rect.width() > 10 and selection_rect.height() > 10:
+            cropped = self.crop(selection_rect)
+            if cropped:
+                self.capture_signal.emit(cropped, selection_rect)
+            self.finish()
+        else:
+            self.update_area(selection_rect)
+            self.start_point = QPoint()
+            self.end_point = QPoint()
+
+    def crop(self, global_rect):
+        """Assemble a global rect from the slices of every screen it touches."""
+        parts = []
+        for overlay in self.overlays.values():
+            part = global_rect.intersected(overlay.geometry())
+            if not part.isEmpty() and overlay.pixmap:
+                parts.append((overlay, part))
+        if not parts:
+            return None
+
+        if len(parts) == 1 and parts[0][1] == global_rect:
+            overlay, part = parts[0]
+            return overlay.pixmap.copy(overlay.source_rect(part.translated(-overlay.geometry().topLeft())))
+
+        result = QPixmap(global_rect.size())
+        result.fill(Qt.GlobalColor.black)  # Dead areas between screens
+        painter = QPainter(result)
+        for overlay, part in parts:
+            source = overlay.source_rect(part.translated(-overlay.geometry().topLeft()))
+            painter.drawPixmap(part.translated(-global_rect.topLeft()), overlay.pixmap, source)
+        painter.end()
+        return result
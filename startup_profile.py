@@ -0,0 +1,61 @@
+import os
+import time
+
+
+def process_age():
+    """Seconds since this process was started, from /proc (Linux only), or None."""
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesised command name; starttime is field 22
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupProfiler:
+    """
+    Records named startup phases for `main.py --profile-startup`. Phases on
+    the GUI thread are timed from the previous mark; background phases pass
+    their own start time so they don't disturb that chain.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.last = self.origin
+        self.phases = []
+        self.pending = set()
+        age = process_age()
+        if age is not None:
+            self.phases.append(("interpreter start (before main.py)", age, 0.0))
+
+    def mark(self, phase, start=None):
+        now = time.perf_counter()
+        self.phases.append((phase, now - (self.last if start is None else start), now - self.origin))
+        if start is None:
+            self.last = now
+
+    def expect(self, *phases):
+        """Declare deferred phases; the report prints once all have been marked done."""
+        self.pending.update(phases)
+
+    def done(self, phase, start=None):
+        self.mark(phase, start)
+        self.pending.discard(phase)
+        if not self.pending:
+            self.report()
+
+    def report(self):
+        if not self.enabled:
+            return
+        width = max(len(name) for name, _, _ in self.phases)
+        print("Startup profile (ms):")
+        print(f"  {'phase':<{width}}  {'took':>8}  {'at':>8}")
+        for name, took, at in self.phases:
+            print(f"  {name:<{width}}  {took * 1000:8.1f}  {at * 1000:8.1f}")
+
+
+profiler = StartupProfiler()
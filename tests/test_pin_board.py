@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QPoint, QRect, QSize
+
+from pin_board import resize_rect
+
+MIN = QSize(100, 100)
+
+
+def test_left_drag_stops_at_minimum():
+    rect = QRect(100, 100, 105, 120)
+    for x in (105, 125, 195, 260):
+        rect = resize_rect(rect, 'l', QPoint(x - rect.left(), 0), MIN)
+    assert rect.width() == 100
+    assert rect.right() == 204
+
+
+def test_top_drag_keeps_bottom_edge():
+    rect = resize_rect(QRect(0, 0, 150, 150), 't', QPoint(0, 80), MIN)
+    assert rect == QRect(0, 50, 150, 100)
+
+
+def test_right_and_bottom_grow_and_clamp():
+    rect = resize_rect(QRect(0, 0, 120, 120), 'br', QPoint(30, -50), MIN)
+    assert rect == QRect(0, 0, 150, 100)
+
+
+def test_left_drag_outward_grows():
+    rect = resize_rect(QRect(100, 0, 100, 100), 'tl', QPoint(-20, -10), MIN)
+    assert rect == QRect(80, -10, 120, 110)
@@ -0,0 +1,140 @@
+import threading
+
+import numpy as np
+from PyQt6.QtCore import QObject, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QPen, QColor
+
+from image_utils import qimage_to_array, array_to_qimage
+
+DEFAULT_TOLERANCE = 24
+BLOCK_SIZE = 16
+HIGHLIGHT_BGRA = np.array([0, 0, 255, 255], dtype=np.uint16)  # Red
+
+
+class DiffResult:
+    def __init__(self, mask, boxes):
+        self.mask = mask
+        self.boxes = boxes  # List of QRect in image coordinates
+        self.changed_pixels = int(mask.sum())
+        self.overlay = None  # QImage, filled in by DiffWorker
+
+    @property
+    def changed_ratio(self):
+        return self.changed_pixels / self.mask.size if self.mask.size else 0.0
+
+
+def pad_to(arr, h, w):
+    if arr.shape[0] == h and arr.shape[1] == w:
+        return arr
+    out = np.zeros((h, w, 4), dtype=np.uint8)
+    out[:arr.shape[0], :arr.shape[1]] = arr
+    return out
+
+
+def compute_mask(before, after, tolerance=DEFAULT_TOLERANCE):
+    """
+    Per-pixel change mask: True where any colour channel differs by more
+    than `tolerance`. Images of different sizes are compared over their
+    union; the area only one of them covers counts as changed.
+    """
+    h = max(before.shape[0], after.shape[0])
+    w = max(before.shape[1], after.shape[1])
+    a = pad_to(before, h, w)
+    b = pad_to(after, h, w)
+
+    # Exact comparison of whole pixels as uint32 (alpha ignored) is cheap and
+    # rules out the unchanged bulk of a typical screenshot in one pass.
+    xor = np.ascontiguousarray(a).view(np.uint32)[:, :, 0] ^ np.ascontiguousarray(b).view(np.uint32)[:, :, 0]
+    mask = (xor & 0x00FFFFFF) != 0
+
+    if tolerance > 0:
+        candidates = np.nonzero(mask)
+        pa = a[candidates][:, :3]
+        pb = b[candidates][:, :3]
+        # max - min stays within uint8, no widening needed
+        delta = (np.maximum(pa, pb) - np.minimum(pa, pb)).max(axis=1)
+        mask[candidates] = delta > tolerance
+
+    if before.shape[:2] != after.shape[:2]:
+        overlap_h = min(before.shape[0], after.shape[0])
+        overlap_w = min(before.shape[1], after.shape[1])
+        mask[overlap_h:, :] = True
+        mask[:, overlap_w:] = True
+    return mask
+
+
+def changed_regions(mask, block=BLOCK_SIZE):
+    """Bounding boxes of connected groups of changed blocks."""
+    h, w = mask.shape
+    gh, gw = -(-h // block), -(-w // block)
+    padded = np.zeros((gh * block, gw * block), dtype=bool)
+    padded[:h, :w] = mask
+    grid = padded.reshape(gh, block, gw, block).any(axis=(1, 3))
+
+    boxes = []
+    seen = np.zeros_like(grid)
+    for start in zip(*np.nonzero(grid)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        stack = [start]
+        top, left, bottom, right = start[0], start[1], start[0], start[1]
+        while stack:
+            y, x = stack.pop()
+            top, bottom = min(top, y), max(bottom, y)
+            left, right = min(left, x), max(right, x)
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < gh and 0 <= nx < gw and grid[ny, nx] and not seen[ny, nx]:
+                    seen[ny, nx] = True
+                    stack.append((ny, nx))
+        rect = QRect(left * block, top * block, (right - left + 1) * block, (bottom - top + 1) * block)
+        boxes.append(rect.intersected(QRect(0, 0, w, h)))
+    return boxes
+
+
+def render_overlay(after, mask):
+    """The newer image with changed pixels tinted red."""
+    h, w = mask.shape
+    out = pad_to(after, h, w).copy()
+    out[mask] = ((out[mask].astype(np.uint16) + HIGHLIGHT_BGRA) // 2).astype(np.uint8)
+    out[:, :, 3] = 255
+    return out
+
+
+def diff_images(before, after, tolerance=DEFAULT_TOLERANCE):
+    """Diff two QImages; returns a DiffResult with an overlay QImage."""
+    a = qimage_to_array(before)
+    b = qimage_to_array(after)
+    mask = compute_mask(a, b, tolerance)
+    result = DiffResult(mask, changed_regions(mask))
+
+    overlay = array_to_qimage(render_overlay(b, mask))
+    painter = QPainter(overlay)
+    painter.setPen(QPen(QColor(255, 0, 0), 2))
+    for box in result.boxes:
+        painter.drawRect(box)
+    painter.end()
+    result.overlay = overlay
+    return result
+
+
+class DiffWorker(QObject):
+    """Runs diff_images on a background thread and reports back via signals."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, before, after, tolerance=DEFAULT_TOLERANCE, parent=None):
+        super().__init__(parent)
+        # QImage is safe to use off the GUI thread, QPixmap is not
+        self.before = before
+        self.after = after
+        self.tolerance = tolerance
+
+    def start(self):
+        threading.Thread(target=self.run, name="bora-diff", daemon=True).start()
+
+    def run(self):
+        try:
+            self.finished.emit(diff_images(self.before, self.after, self.tolerance))
+        except Exception as e:
+            self.failed.emit(str(e))
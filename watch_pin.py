@@ -0,0 +1,100 @@
+import numpy as np
+from PyQt6.QtCore import QObject, QRect, QTimer
+
+from config_manager import ConfigManager
+from image_utils import qimage_to_array
+
+TILE_SIZE = 32
+DEFAULT_INTERVAL_MS = 1000
+# Idle pins slow down to this many times the configured interval
+MAX_BACKOFF = 16
+
+# Fixed odd multipliers, one per pixel position in a tile; the weighted sum
+# (wrapping mod 2**64) changes whenever any pixel in the tile does.
+_WEIGHTS = np.random.default_rng(0x626f7261).integers(
+    1, 2 ** 63, size=TILE_SIZE * TILE_SIZE, dtype=np.uint64) | np.uint64(1)
+
+
+def watch_supported():
+    """
+    Watching grabs on the GUI thread every tick, which is only cheap with a
+    backend that can grab a single region. gnome-screenshot (the Wayland
+    fallback) runs a full-desktop subprocess each time, so it is excluded.
+    """
+    import capture_backends
+
+    # Never benchmark just to answer this (e.g. while restoring the session)
+    backends = capture_backends.ranked_backends(measure=False)
+    return bool(backends) and backends[0].region_grabs
+
+
+def tile_hashes(arr, tile=TILE_SIZE):
+    """Hash an (h, w, 4) uint8 frame into a (rows, cols) grid of uint64 tile hashes."""
+    h, w = arr.shape[:2]
+    rows, cols = -(-h // tile), -(-w // tile)
+    pixels = np.zeros((rows * tile, cols * tile), dtype=np.uint32)
+    pixels[:h, :w] = np.ascontiguousarray(arr).view(np.uint32)[:, :, 0]
+    tiles = pixels.reshape(rows, tile, cols, tile).transpose(0, 2, 1, 3).reshape(rows, cols, tile * tile)
+    return (tiles.astype(np.uint64) * _WEIGHTS[:tile * tile]).sum(axis=2, dtype=np.uint64)
+
+
+class PinWatcher(QObject):
+    """
+    Keeps a FloatingWidget in sync with its source rect: re-grabs it on a
+    timer, compares tile hashes with the previous frame and hands only the
+    changed tiles to the widget. The interval doubles while nothing changes
+    (up to MAX_BACKOFF times) and snaps back on the first change.
+    """
+
+    def __init__(self, widget, interval_ms=None):
+        super().__init__(widget)
+        self.widget = widget
+        self.interval = interval_ms or ConfigManager.get('watch_interval_ms', DEFAULT_INTERVAL_MS)
+        self.current_interval = self.interval
+        self.hashes = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self, delay_ms=0):
+        self.hashes = None
+        self.current_interval = self.interval
+        self.timer.start(delay_ms)
+
+    def stop(self):
+        self.timer.stop()
+
+    def tick(self):
+        import capture_backends
+
+        if not watch_supported():
+            self.widget.set_watching(False)
+            return
+        if self.widget.isVisible():
+            try:
+                image = capture_backends.grab(self.widget.source_rect)
+            except capture_backends.CaptureError as e:
+                print(f"Watch pin grab failed: {e}")
+                image = None
+            if image is not None:
+                self.process(image)
+        self.timer.start(self.current_interval)
+
+    def process(self, image):
+        hashes = tile_hashes(qimage_to_array(image))
+        if self.hashes is None or hashes.shape != self.hashes.shape:
+            self.widget.apply_frame(image)
+            changed = True
+        else:
+            rows, cols = np.nonzero(hashes != self.hashes)
+            changed = len(rows) > 0
+            if changed:
+                rects = [QRect(int(c) * TILE_SIZE, int(r) * TILE_SIZE, TILE_SIZE, TILE_SIZE) for r, c in zip(rows, cols)]
+                self.widget.apply_tiles(image, rects)
+        self.hashes = hashes
+
+        if changed:
+            self.current_interval = self.interval
+        else:
+            self.current_interval = min(self.current_interval * 2, self.interval * MAX_BACKOFF)